@@ -5,7 +5,9 @@ Provides dynamic configuration loading with support for different
 environments and secure settings management.
 """
 
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional
+from pydantic import computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 
@@ -20,6 +22,18 @@ class Settings(BaseSettings):
     # Database configuration
     DATABASE_URL: str = "sqlite+aiosqlite:///telegram_manager.db"
 
+    # SQLite write-path tuning. The defaults trade a little durability
+    # for far fewer fsyncs (safe under WAL); tests can set
+    # DB_SYNCHRONOUS=OFF for throwaway fixtures
+    DB_JOURNAL_MODE: str = "WAL"
+    DB_SYNCHRONOUS: str = "NORMAL"
+    DB_BUSY_TIMEOUT: int = 5000
+
+    # Number of read-only connections in the query pool. WAL allows
+    # readers to run in parallel; size this to the expected number of
+    # concurrent request handlers hitting read endpoints
+    DB_READ_POOL_SIZE: int = 4
+
     # Telegram API credentials
     API_ID: Optional[str] = None
     API_HASH: Optional[str] = None
@@ -29,6 +43,16 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     DEBUG: bool = False
 
+    # CORS configuration (comma-separated list of allowed origins)
+    CORS_ORIGINS: str = "http://localhost:5173,http://localhost:3000"
+
+    # API server binding
+    API_HOST: str = "0.0.0.0"
+    API_PORT: int = 8000
+
+    # Media storage
+    MEDIA_PATH: str = "./data/media"
+
     # Environment-specific configuration
     ENVIRONMENT: str = "development"
 
@@ -52,12 +76,31 @@ class Settings(BaseSettings):
             return self.DATABASE_URL.split("///")[1]
         return "telegram_manager.db"
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def cors_origins(self) -> List[str]:
+        """
+        Parse CORS_ORIGINS into a list of origins.
+
+        The env var stays a plain comma-separated string so it can be set
+        without JSON quoting; parsing happens in pydantic-core via the
+        computed field instead of ad-hoc os.getenv handling at call sites.
+        """
+        return [
+            origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip()
+        ]
+
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Retrieve cached application settings.
 
+    Settings are only constructed on the first call; constructing a
+    BaseSettings instance scans the environment and runs validators,
+    so callers should always go through this accessor rather than
+    instantiating Settings() directly.
+
     Returns:
         Settings: Configured application settings
     """
@@ -71,3 +114,27 @@ def reset_settings_cache():
     Useful for testing and dynamic configuration changes.
     """
     get_settings.cache_clear()
+
+
+# Directories already created by ensure_directories_exist; repeated calls
+# for the same path skip the mkdir syscall entirely
+_ensured_directories: set = set()
+
+
+def ensure_directories_exist(*directories) -> None:
+    """
+    Create directories if needed, skipping ones already ensured.
+
+    Each Path.mkdir costs a syscall even when the directory already
+    exists, so callers that run on hot paths (startup, connection
+    setup) can invoke this defensively without paying per call.
+
+    Args:
+        *directories: Directory paths (str or Path) to create
+    """
+    for directory in directories:
+        key = str(directory)
+        if key in _ensured_directories:
+            continue
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        _ensured_directories.add(key)
@@ -22,13 +22,21 @@ Usage:
     await run_migrations(db)
 """
 
-from .connection import DatabaseConnection, get_database, init_database, close_database
+from .connection import (
+    DatabaseConnection,
+    DatabaseConnectionPool,
+    get_database,
+    init_database,
+    close_database,
+)
+from .sync_connection import SyncDatabase
 from .migration_runner import (
     run_migrations,
     verify_schema,
     create_tables,
     get_schema_version,
     get_database_stats,
+    get_database_stats_sync,
     drop_all_tables,
     reset_database,
     get_migration_status,
@@ -41,6 +49,8 @@ from .migration_runner import (
 __all__ = [
     # Connection management
     "DatabaseConnection",
+    "DatabaseConnectionPool",
+    "SyncDatabase",
     "get_database",
     "init_database",
     "close_database",
@@ -50,6 +60,7 @@ __all__ = [
     "create_tables",
     "get_schema_version",
     "get_database_stats",
+    "get_database_stats_sync",
     "drop_all_tables",
     "reset_database",
     "get_migration_status",
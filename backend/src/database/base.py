@@ -6,6 +6,9 @@ providing a foundation for creating database models with common configurations
 and utility methods.
 """
 
+import operator
+from datetime import datetime, timezone
+
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy import Column, DateTime, func
 from sqlalchemy.ext.declarative import declared_attr
@@ -13,6 +16,28 @@ from sqlalchemy.ext.declarative import declared_attr
 from typing import Any
 
 
+def utcnow() -> datetime:
+    """
+    Naive UTC now, replacing the deprecated datetime.utcnow.
+
+    Keeps microsecond precision and the naive semantics the existing
+    columns and comparisons rely on, while going through the
+    non-deprecated timezone-aware API internally.
+
+    This is deliberately a Python-side default rather than a
+    server_default: SQLite's CURRENT_TIMESTAMP has one-second
+    resolution, which would make back-to-back writes share a timestamp
+    and break updated_at monotonicity, and with an embedded database
+    the "DB clock" is this process's clock anyway. Python-side defaults
+    are also populated on the instance at flush, so no RETURNING or
+    refresh round trip is needed to read them back.
+
+    Returns:
+        datetime: Current UTC time without tzinfo
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class Base(DeclarativeBase):
     """
     Base declarative class for all database models.
@@ -65,11 +90,22 @@ class Base(DeclarativeBase):
         """
         Convert model instance to a dictionary.
 
-        Useful for serialization and API responses.
+        Useful for serialization and API responses. The column-name tuple
+        and an attrgetter are computed once per mapped class and cached,
+        so serialization loops fetch all values in a single C-level call
+        instead of one Python getattr per column.
 
         Returns:
             dict: Dictionary representation of the model instance
         """
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
+        cls = type(self)
+        cached = cls.__dict__.get("_to_dict_cache")
+        if cached is None:
+            columns = tuple(column.name for column in self.__table__.columns)
+            getter = operator.attrgetter(*columns)
+            cached = cls._to_dict_cache = (columns, getter)
+
+        columns, getter = cached
+        if len(columns) == 1:
+            return {columns[0]: getter(self)}
+        return dict(zip(columns, getter(self)))
@@ -10,10 +10,18 @@ from typing import Optional
 from contextlib import asynccontextmanager
 import logging
 
-from src.config import get_settings
+from src.config import get_settings, ensure_directories_exist
 
 logger = logging.getLogger(__name__)
 
+# Size of sqlite3's per-connection compiled-statement cache. The driver
+# keys prepared statements by SQL text, so repeated queries (contact
+# lookups, message inserts, migrations bookkeeping) skip the parse/plan
+# step entirely as long as they fit in this cache. Shared by every
+# connection class so the main connection, the read pool and the sync
+# CLI connection behave identically
+CACHED_STATEMENTS = 256
+
 
 class DatabaseConnection:
     """
@@ -31,6 +39,10 @@ class DatabaseConnection:
         self.database_path = Path(database_path)
         self._connection: Optional[aiosqlite.Connection] = None
         self._lock = asyncio.Lock()
+        # Positive cache of known table names, seeded at connect time.
+        # Misses fall through to sqlite_master; DDL that drops tables must
+        # call invalidate_table_cache()
+        self._tables: Optional[set] = None
 
     async def connect(self) -> aiosqlite.Connection:
         """
@@ -40,26 +52,64 @@ class DatabaseConnection:
         Returns:
             aiosqlite.Connection: Active database connection
         """
+        # Fast path: skip the lock entirely once connected; the lock only
+        # needs to serialize first-time creation
+        if self._connection is not None:
+            return self._connection
+
         async with self._lock:
             if self._connection is None:
-                # Ensure parent directory exists
-                self.database_path.parent.mkdir(parents=True, exist_ok=True)
+                # Ensure parent directory exists (memoized across calls)
+                ensure_directories_exist(self.database_path.parent)
 
                 # Connect to database
+                # cached_statements keeps compiled statements around so
+                # repeated queries skip SQLite's parse/plan step.
+                # isolation_level=None disables the driver's implicit
+                # BEGIN/COMMIT state machine; transactions are controlled
+                # explicitly via transaction()
                 self._connection = await aiosqlite.connect(
                     str(self.database_path),
                     timeout=30.0,
+                    isolation_level=None,
+                    cached_statements=CACHED_STATEMENTS,
                 )
 
-                # Enable foreign key constraints
-                await self._connection.execute("PRAGMA foreign_keys = ON")
-
-                # Set journal mode to WAL for better concurrency
-                await self._connection.execute("PRAGMA journal_mode = WAL")
+                # Configure the connection in one batch to save round-trips:
+                # - foreign_keys: enforce foreign key constraints
+                # - journal_mode (default WAL): better reader/writer concurrency
+                # - synchronous (default NORMAL): fewer fsyncs (safe with WAL)
+                # - mmap_size: memory-map up to 256 MB to avoid read syscalls
+                # - cache_size: 64 MB page cache
+                # - temp_store=MEMORY: keep temp tables/indexes off disk
+                # - busy_timeout: wait instead of failing on a locked database
+                # journal mode, synchronous level and busy timeout are
+                # overridable through settings (DB_JOURNAL_MODE, ...)
+                settings = get_settings()
+                await self._connection.executescript(
+                    f"""
+                    PRAGMA foreign_keys = ON;
+                    PRAGMA journal_mode = {settings.DB_JOURNAL_MODE};
+                    PRAGMA synchronous = {settings.DB_SYNCHRONOUS};
+                    PRAGMA mmap_size = 268435456;
+                    PRAGMA cache_size = -65536;
+                    PRAGMA temp_store = MEMORY;
+                    PRAGMA busy_timeout = {settings.DB_BUSY_TIMEOUT};
+                    PRAGMA journal_size_limit = 67108864;
+                    """
+                )
 
                 # Commit pragma settings
                 await self._connection.commit()
 
+                # Seed the table-name cache so table_exists checks are
+                # in-memory set lookups instead of sqlite_master queries
+                cursor = await self._connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table'"
+                )
+                rows = await cursor.fetchall()
+                self._tables = {row[0] for row in rows}
+
                 logger.info(f"Connected to database: {self.database_path}")
 
             return self._connection
@@ -72,6 +122,7 @@ class DatabaseConnection:
             if self._connection is not None:
                 await self._connection.close()
                 self._connection = None
+                self._tables = None
                 logger.info("Database connection closed")
 
     async def get_connection(self) -> aiosqlite.Connection:
@@ -81,23 +132,29 @@ class DatabaseConnection:
         Returns:
             aiosqlite.Connection: Active database connection
         """
-        if self._connection is None:
-            await self.connect()
-        return self._connection
+        if self._connection is not None:
+            return self._connection
+        return await self.connect()
 
     @asynccontextmanager
-    async def transaction(self):
+    async def transaction(self, immediate: bool = True):
         """
         Context manager for database transactions
         Automatically commits on success, rolls back on error
 
+        Write transactions open with BEGIN IMMEDIATE by default: the
+        write lock is taken upfront instead of on the first write, so a
+        deferred-to-write lock upgrade can never hit SQLITE_BUSY midway
+        through the block (busy_timeout applies once, at BEGIN). Pass
+        immediate=False for read-only transactions.
+
         Usage:
             async with db.transaction():
                 await db.execute("INSERT INTO ...", ...)
         """
         conn = await self.get_connection()
         try:
-            await conn.execute("BEGIN")
+            await conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
             yield conn
             await conn.commit()
         except Exception as e:
@@ -109,6 +166,9 @@ class DatabaseConnection:
         """
         Execute a single SQL statement
 
+        The connection runs in autocommit mode (isolation_level=None);
+        wrap related writes in transaction() for atomicity.
+
         Args:
             query: SQL query string
             parameters: Query parameters (optional)
@@ -121,10 +181,32 @@ class DatabaseConnection:
             return await conn.execute(query, parameters)
         return await conn.execute(query)
 
+    async def executescript(self, script: str):
+        """
+        Execute multiple semicolon-separated SQL statements in one call
+
+        Avoids a Python round-trip per statement for large DDL batches.
+        Note sqlite3 semantics: any transaction open on the connection is
+        implicitly committed before the script runs, and each statement
+        in the script autocommits unless the script itself contains
+        BEGIN/COMMIT.
+
+        Args:
+            script: SQL script with one or more statements
+
+        Returns:
+            Cursor object
+        """
+        conn = await self.get_connection()
+        return await conn.executescript(script)
+
     async def execute_many(self, query: str, parameters_list):
         """
         Execute a SQL statement with multiple parameter sets
 
+        Runs in autocommit mode like execute(); use transaction() to
+        batch the writes into one commit.
+
         Args:
             query: SQL query string
             parameters_list: List of parameter tuples
@@ -135,6 +217,56 @@ class DatabaseConnection:
         conn = await self.get_connection()
         return await conn.executemany(query, parameters_list)
 
+    async def bulk_insert(
+        self, table: str, columns, rows, chunk_size: int = 500
+    ) -> int:
+        """
+        Insert many rows in one transaction via chunked executemany
+
+        Row-at-a-time inserts pay a WAL commit and a thread hop each;
+        wrapping the whole batch in a single BEGIN IMMEDIATE and feeding
+        executemany in chunks amortizes both, which is the difference
+        between hundreds and hundreds of thousands of rows per second on
+        sync ingest. Chunking keeps peak memory bounded when rows is a
+        generator.
+
+        Args:
+            table: Target table name
+            columns: Column names matching the row tuples
+            rows: Iterable of parameter tuples
+            chunk_size: Rows per executemany call
+
+        Returns:
+            Number of rows inserted
+        """
+        columns = list(columns)
+        placeholders = ", ".join("?" for _ in columns)
+        sql = (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({placeholders})"
+        )
+
+        conn = await self.get_connection()
+        total = 0
+        await conn.execute("BEGIN IMMEDIATE")
+        try:
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= chunk_size:
+                    await conn.executemany(sql, batch)
+                    total += len(batch)
+                    batch = []
+            if batch:
+                await conn.executemany(sql, batch)
+                total += len(batch)
+            await conn.commit()
+        except Exception:
+            await conn.rollback()
+            raise
+
+        return total
+
     async def fetch_one(self, query: str, parameters=None):
         """
         Execute query and fetch a single row
@@ -163,6 +295,24 @@ class DatabaseConnection:
         cursor = await self.execute(query, parameters)
         return await cursor.fetchall()
 
+    async def iter_rows(self, query: str, parameters=None):
+        """
+        Execute query and yield rows one at a time
+
+        Streams from the cursor instead of materializing the full
+        result list, so memory stays O(1) in the row count.
+
+        Args:
+            query: SQL query string
+            parameters: Query parameters (optional)
+
+        Yields:
+            Rows as tuples
+        """
+        cursor = await self.execute(query, parameters)
+        async for row in cursor:
+            yield row
+
     async def commit(self):
         """
         Commit current transaction
@@ -187,13 +337,32 @@ class DatabaseConnection:
         Returns:
             True if table exists, False otherwise
         """
+        # Fast path: serve from the in-memory cache seeded at connect
+        if self._tables is not None and table_name in self._tables:
+            return True
+
+        # Miss: re-query sqlite_master (covers tables created after
+        # connect) and remember positive answers
         query = """
             SELECT name FROM sqlite_master
             WHERE type='table' AND name=?
         """
         result = await self.fetch_one(query, (table_name,))
+        if result is not None and self._tables is not None:
+            self._tables.add(table_name)
         return result is not None
 
+    def invalidate_table_cache(self):
+        """
+        Clear the cached table-name set
+
+        Must be called after DDL that drops tables so table_exists does
+        not report stale positives; subsequent checks re-query
+        sqlite_master and re-warm the cache.
+        """
+        if self._tables is not None:
+            self._tables = set()
+
     async def get_table_count(self, table_name: str) -> int:
         """
         Get row count for a table
@@ -213,6 +382,119 @@ class DatabaseConnection:
         return f"DatabaseConnection(path={self.database_path}, status={status})"
 
 
+class DatabaseConnectionPool:
+    """
+    Fixed-size pool of read-only SQLite connections
+
+    Under WAL mode SQLite supports many concurrent readers, but the single
+    shared DatabaseConnection serializes all queries through one connection.
+    Spreading independent SELECTs across pool members lets them run in
+    parallel at the SQLite level.
+    """
+
+    def __init__(self, database_path: str, size: Optional[int] = None):
+        """
+        Initialize the read pool
+
+        Args:
+            database_path: Path to SQLite database file
+            size: Number of pooled connections; defaults to the
+                DB_READ_POOL_SIZE setting
+        """
+        self.database_path = Path(database_path)
+        self.size = size if size is not None else get_settings().DB_READ_POOL_SIZE
+        self._connections: list = []
+        self._available: Optional[asyncio.Queue] = None
+        self._lock = asyncio.Lock()
+
+    async def open(self):
+        """
+        Open all pooled connections (idempotent)
+        """
+        if self._connections:
+            return
+
+        async with self._lock:
+            if self._connections:
+                return
+
+            settings = get_settings()
+            available = asyncio.Queue()
+            for _ in range(self.size):
+                conn = await aiosqlite.connect(
+                    str(self.database_path),
+                    timeout=30.0,
+                    cached_statements=CACHED_STATEMENTS,
+                )
+                # Same read-side tuning as the write connection, in one
+                # batch; query_only makes explicit that readers never
+                # write. journal_mode is a database property under WAL,
+                # so readers inherit it without setting it here
+                await conn.executescript(
+                    f"""
+                    PRAGMA query_only = ON;
+                    PRAGMA mmap_size = 268435456;
+                    PRAGMA cache_size = -65536;
+                    PRAGMA temp_store = MEMORY;
+                    PRAGMA busy_timeout = {settings.DB_BUSY_TIMEOUT};
+                    """
+                )
+                self._connections.append(conn)
+                available.put_nowait(conn)
+
+            self._available = available
+            logger.info(
+                f"Opened read pool of {self.size} connections: {self.database_path}"
+            )
+
+    @asynccontextmanager
+    async def acquire(self):
+        """
+        Borrow a connection from the pool
+
+        Usage:
+            async with pool.acquire() as conn:
+                cursor = await conn.execute("SELECT ...")
+        """
+        await self.open()
+        conn = await self._available.get()
+        try:
+            yield conn
+        finally:
+            self._available.put_nowait(conn)
+
+    async def fetch_one(self, query: str, parameters=None):
+        """
+        Execute query on a pooled connection and fetch a single row
+        """
+        async with self.acquire() as conn:
+            cursor = await conn.execute(query, parameters or ())
+            return await cursor.fetchone()
+
+    async def fetch_all(self, query: str, parameters=None):
+        """
+        Execute query on a pooled connection and fetch all rows
+        """
+        async with self.acquire() as conn:
+            cursor = await conn.execute(query, parameters or ())
+            return await cursor.fetchall()
+
+    async def close(self):
+        """
+        Close all pooled connections
+        """
+        async with self._lock:
+            for conn in self._connections:
+                await conn.close()
+            self._connections = []
+            self._available = None
+            logger.info("Read pool closed")
+
+    def __repr__(self) -> str:
+        status = "open" if self._connections else "closed"
+        return f"DatabaseConnectionPool(path={self.database_path}, size={self.size}, status={status})"
+
+
 # Global database instance
 _database: Optional[DatabaseConnection] = None
 
@@ -260,6 +542,18 @@ async def init_database():
     """
     db = get_database()
     await db.connect()
+
+    # Refresh planner statistics opportunistically. analysis_limit caps
+    # the rows examined so this stays cheap even on large tables, and
+    # the resulting sqlite_stat1 entries also feed the estimated row
+    # counts used by get_database_stats
+    try:
+        await db.execute("PRAGMA analysis_limit = 1000")
+        await db.execute("ANALYZE")
+        await db.commit()
+    except Exception as e:
+        logger.debug(f"ANALYZE skipped: {e}")
+
     logger.info("Database initialized")
     return db
 
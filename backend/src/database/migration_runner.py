@@ -14,9 +14,10 @@ Migration files are located in: database/migrations/
 Each migration is a separate file following the pattern: migration_XXX_description.py
 """
 
+import asyncio
 import logging
 from typing import Dict, List
-from .connection import DatabaseConnection
+from .connection import DatabaseConnection, DatabaseConnectionPool
 from .migrations import (
     run_migrations as _run_migrations,
     verify_schema as _verify_schema,
@@ -31,6 +32,11 @@ logger = logging.getLogger(__name__)
 # Schema version constant for backward compatibility
 SCHEMA_VERSION = 1
 
+# In-process cache for get_schema_version: (token, version)
+# The token lives in session_config under 'schema_version_tok' and is
+# bumped by the migration manager whenever the applied set changes
+_schema_version_cache = None
+
 
 async def create_tables(db: DatabaseConnection) -> bool:
     """
@@ -59,7 +65,25 @@ async def get_schema_version(db: DatabaseConnection) -> int:
     Returns:
         Current schema version, 0 if not set
     """
+    global _schema_version_cache
+
     try:
+        # Cheap cache probe: if the schema token hasn't changed since the
+        # last call, skip re-reading the _migrations table entirely
+        token = None
+        try:
+            row = await db.fetch_one(
+                "SELECT value FROM session_config WHERE key = 'schema_version_tok'"
+            )
+            token = row[0] if row else None
+        except Exception:
+            pass  # session_config may not exist yet
+
+        if token is not None and _schema_version_cache is not None:
+            cached_token, cached_version = _schema_version_cache
+            if cached_token == token:
+                return cached_version
+
         # Check if we have any applied migrations
         manager = get_migration_manager(db)
         await manager.init_migrations_table()
@@ -71,35 +95,208 @@ async def get_schema_version(db: DatabaseConnection) -> int:
 
         # Return the highest migration version as an integer
         versions = [int(v) for v in applied.keys()]
-        return max(versions) if versions else 0
+        version = max(versions) if versions else 0
+
+        if token is not None:
+            _schema_version_cache = (token, version)
+
+        return version
     except Exception as e:
         logger.warning(f"Could not get schema version: {e}")
         return 0
 
 
-async def get_database_stats(db: DatabaseConnection) -> dict:
+async def load_session_config(db: DatabaseConnection) -> dict:
+    """
+    Load every session_config key/value pair in one query
+
+    The table typically holds well under twenty rows, so startup code
+    that needs several keys should fetch the whole table once and read
+    from the dict instead of issuing one SELECT per key.
+
+    Args:
+        db: DatabaseConnection instance
+
+    Returns:
+        Dict mapping config keys to values (empty if the table does
+        not exist yet)
+    """
+    try:
+        rows = await db.fetch_all("SELECT key, value FROM session_config")
+    except Exception:
+        return {}
+    return dict(rows)
+
+
+# Tables reported by the database statistics helpers
+STATS_TABLES = ["contacts", "groups", "tags", "messages", "sync_log"]
+
+_STAT1_QUERY = "SELECT tbl, stat FROM sqlite_stat1"
+
+
+def _estimates_from_stat1(rows, tables) -> tuple:
+    """
+    Parse sqlite_stat1 rows into per-table row-count estimates
+
+    The first whitespace-separated token of the stat column is the
+    estimated row count written by ANALYZE.
+
+    Args:
+        rows: (tbl, stat) tuples from the sqlite_stat1 table
+        tables: Table names of interest
+
+    Returns:
+        (stats, remaining): estimated counts for tables that have
+        statistics, and the tables that still need a real COUNT
+    """
+    estimates = {}
+    for tbl, stat in rows:
+        try:
+            estimates[tbl] = int(str(stat).split()[0])
+        except (ValueError, IndexError):
+            pass
+
+    stats = {table: estimates[table] for table in tables if table in estimates}
+    remaining = [table for table in tables if table not in estimates]
+    return stats, remaining
+
+
+def _union_count_query(tables) -> str:
+    """Build one UNION ALL query counting every table in a single pass"""
+    if tables == STATS_TABLES:
+        # Common case (exact counts, or no stat1 rows at all): serve the
+        # query rendered once at import instead of rebuilding the string
+        return _FULL_UNION_QUERY
+    return " UNION ALL ".join(
+        f"SELECT '{table}', COUNT(*) FROM {table}" for table in tables
+    )
+
+
+_FULL_UNION_QUERY = " UNION ALL ".join(
+    f"SELECT '{table}', COUNT(*) FROM {table}" for table in STATS_TABLES
+)
+
+
+async def get_database_stats(db: DatabaseConnection, exact: bool = False) -> dict:
     """
     Get statistics about database contents
 
     Args:
         db: DatabaseConnection instance
+        exact: When True, run full COUNT(*) scans. Otherwise serve row
+            counts from the sqlite_stat1 estimates written by ANALYZE
+            (an O(1) metadata lookup vs an O(N) table scan) and only
+            scan tables that have no statistics yet
+
+    Returns:
+        Dictionary with table row counts
+    """
+    tables = STATS_TABLES
+
+    stats = {}
+    remaining = tables
+
+    if not exact:
+        try:
+            rows = await db.fetch_all(_STAT1_QUERY)
+            stats, remaining = _estimates_from_stat1(rows, tables)
+
+            if not remaining:
+                return stats
+        except Exception:
+            # No sqlite_stat1 yet (ANALYZE never ran); fall through to scans
+            remaining = tables
+
+    # Count the remaining tables in one batched query (one cursor
+    # round-trip instead of one per table)
+    try:
+        rows = await db.fetch_all(_union_count_query(remaining))
+        stats.update({row[0]: row[1] for row in rows})
+        return {table: stats[table] for table in tables if table in stats}
+    except Exception as e:
+        logger.warning(f"Batched stats query failed, counting per table: {e}")
+
+    # Fallback: count each table individually, dispatching all counts
+    # concurrently so a missing table only affects its own entry. For
+    # file-backed databases the counts run on a read pool, so WAL lets
+    # them execute in parallel instead of queueing on the one shared
+    # connection (an in-memory database is private to its connection,
+    # so pool members would not see its tables)
+    if str(db.database_path) != ":memory:":
+        pool = DatabaseConnectionPool(
+            str(db.database_path), size=min(4, len(remaining))
+        )
+        try:
+            results = await asyncio.gather(
+                *(
+                    pool.fetch_one(f"SELECT COUNT(*) FROM {table}")
+                    for table in remaining
+                ),
+                return_exceptions=True,
+            )
+            results = [r if isinstance(r, Exception) else r[0] for r in results]
+        finally:
+            await pool.close()
+    else:
+        results = await asyncio.gather(
+            *(db.get_table_count(table) for table in remaining),
+            return_exceptions=True,
+        )
+
+    for table, result in zip(remaining, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error getting count for {table}: {result}")
+            stats[table] = -1
+        else:
+            stats[table] = result
+
+    return {table: stats[table] for table in tables if table in stats}
+
+
+def get_database_stats_sync(db, exact: bool = False) -> dict:
+    """
+    Synchronous twin of get_database_stats for SyncDatabase callers
+
+    Shares the estimate parsing and batched-count query builders with
+    the async version so the two paths cannot drift apart.
+
+    Args:
+        db: SyncDatabase instance (any object with sync fetch_all /
+            get_table_count)
+        exact: When True, run full COUNT(*) scans instead of serving
+            estimates from sqlite_stat1
 
     Returns:
         Dictionary with table row counts
     """
+    tables = STATS_TABLES
+
     stats = {}
+    remaining = tables
+
+    if not exact:
+        try:
+            stats, remaining = _estimates_from_stat1(db.fetch_all(_STAT1_QUERY), tables)
 
-    tables = ["contacts", "groups", "tags", "messages", "sync_log"]
+            if not remaining:
+                return stats
+        except Exception:
+            remaining = tables
 
-    for table in tables:
+    try:
+        stats.update(dict(db.fetch_all(_union_count_query(remaining))))
+        return {table: stats[table] for table in tables if table in stats}
+    except Exception as e:
+        logger.warning(f"Batched stats query failed, counting per table: {e}")
+
+    for table in remaining:
         try:
-            count = await db.get_table_count(table)
-            stats[table] = count
+            stats[table] = db.get_table_count(table)
         except Exception as e:
             logger.error(f"Error getting count for {table}: {e}")
             stats[table] = -1
 
-    return stats
+    return {table: stats[table] for table in tables if table in stats}
 
 
 async def drop_all_tables(db: DatabaseConnection):
@@ -124,10 +321,26 @@ async def drop_all_tables(db: DatabaseConnection):
         "_migrations",  # Also drop the migrations tracking table
     ]
 
-    for table in tables:
-        await db.execute(f"DROP TABLE IF EXISTS {table}")
-
-    await db.commit()
+    # Drop everything in one executescript call wrapped in a savepoint:
+    # a single round-trip and a single atomic WAL commit instead of one
+    # per table. Foreign-key enforcement is switched off for the batch
+    # (the pragma must precede the savepoint — it is a no-op inside a
+    # transaction) so drop order does not matter and SQLite skips the
+    # per-row FK checks that cascading drops would otherwise trigger
+    drops = ";\n".join(f"DROP TABLE IF EXISTS {table}" for table in tables)
+    script = (
+        "PRAGMA foreign_keys = OFF;\n"
+        "SAVEPOINT drop_all;\n"
+        f"{drops};\n"
+        "RELEASE drop_all;\n"
+        "PRAGMA foreign_keys = ON;"
+    )
+
+    conn = await db.get_connection()
+    await conn.executescript(script)
+    db.invalidate_table_cache()
+    # The _migrations table is gone too; forget any cached applied set
+    get_migration_manager(db).invalidate_applied_cache()
     logger.warning("All tables dropped")
 
 
@@ -158,7 +371,9 @@ __all__ = [
     "verify_schema",
     "create_tables",
     "get_schema_version",
+    "load_session_config",
     "get_database_stats",
+    "get_database_stats_sync",
     "drop_all_tables",
     "reset_database",
     "get_migration_status",
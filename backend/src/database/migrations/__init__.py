@@ -3,8 +3,12 @@ Database Migration System
 Tracks and executes database migrations with proper versioning
 """
 
+import bisect
+import hashlib
+import heapq
 import logging
 import os
+import uuid
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
@@ -16,10 +20,25 @@ logger = logging.getLogger(__name__)
 class Migration:
     """Represents a single database migration"""
 
-    def __init__(self, version: str, name: str, description: str = ""):
+    def __init__(
+        self,
+        version: str,
+        name: str,
+        description: str = "",
+        depends_on: Optional[List[str]] = None,
+        sql_body: str = "",
+    ):
         self.version = version
         self.name = name
         self.description = description
+        # Versions that must be applied before this migration; ordering
+        # falls back to the version string when no edges are declared
+        self.depends_on: List[str] = depends_on or []
+        # Checksum of the migration's SQL, stored in _migrations so a
+        # later run can detect that an applied migration's source changed
+        self.checksum: Optional[str] = (
+            hashlib.sha256(sql_body.encode()).hexdigest() if sql_body else None
+        )
         self.applied_at: Optional[datetime] = None
 
     async def up(self, db: DatabaseConnection):
@@ -40,6 +59,19 @@ class MigrationManager:
     def __init__(self, db: DatabaseConnection):
         self.db = db
         self.migrations: List[Migration] = []
+        # Version strings parallel to self.migrations, kept sorted so
+        # register_migration can insert in O(log N) instead of re-sorting
+        self._versions: List[str] = []
+        # Version -> migration map for O(1) lookups (rollback, ordering)
+        self._by_version: Dict[str, Migration] = {}
+        # Applied-version set, loaded once per manager and kept in sync by
+        # mark_migration_applied / rollback, so applied checks don't each
+        # round-trip to the database
+        self._applied_cache: Optional[set] = None
+        # Memoized (key, status) pair for get_migration_status; the key
+        # is a one-row aggregate over _migrations plus the number of
+        # registered migrations, so stale results are detected cheaply
+        self._status_cache: Optional[tuple] = None
 
     async def init_migrations_table(self):
         """Create the migrations tracking table if it doesn't exist"""
@@ -53,46 +85,262 @@ class MigrationManager:
         );
         """
         await self.db.execute(create_table_sql)
+        # CREATE TABLE IF NOT EXISTS is a no-op on databases whose
+        # _migrations table predates the checksum column, while the
+        # tracking INSERTs bind that column unconditionally; add it in
+        # place so pre-existing databases keep migrating
+        columns = await self.db.fetch_all("PRAGMA table_info(_migrations)")
+        if "checksum" not in {column[1] for column in columns}:
+            await self.db.execute(
+                "ALTER TABLE _migrations ADD COLUMN checksum TEXT"
+            )
+            logger.info("Added checksum column to legacy _migrations table")
         await self.db.commit()
         logger.info("Migrations tracking table initialized")
 
     async def get_applied_migrations(self) -> Dict[str, datetime]:
         """Get list of already applied migrations"""
         try:
-            rows = await self.db.fetch_all(
+            # Stream rows straight into the dict rather than building
+            # an intermediate list first
+            result = {}
+            async for version, applied_at in self.db.iter_rows(
                 "SELECT version, applied_at FROM _migrations ORDER BY version"
-            )
-            return {row[0]: row[1] for row in rows}
+            ):
+                result[version] = applied_at
+            return result
         except Exception as e:
-            logger.warning(f"Could not fetch applied migrations: {e}")
+            logger.warning("Could not fetch applied migrations: %s", e)
             return {}
 
-    async def mark_migration_applied(self, migration: Migration):
-        """Mark a migration as applied"""
+    async def _load_applied_cache(self) -> set:
+        """Load the applied-version set once and serve checks from memory"""
+        if self._applied_cache is None:
+            try:
+                rows = await self.db.fetch_all("SELECT version FROM _migrations")
+                self._applied_cache = {row[0] for row in rows}
+            except Exception as e:
+                logger.warning("Could not load applied migrations: %s", e)
+                self._applied_cache = set()
+        return self._applied_cache
+
+    def invalidate_applied_cache(self):
+        """
+        Forget the cached applied-version set
+
+        Must be called when the _migrations table is modified outside the
+        manager (e.g. dropped during a database reset).
+        """
+        self._applied_cache = None
+        self._status_cache = None
+
+    @staticmethod
+    def _build_applied_row(migration: Migration) -> tuple:
+        """
+        Build the _migrations parameter tuple for one migration
+
+        applied_at is deliberately omitted: the column's DEFAULT
+        CURRENT_TIMESTAMP fills it in SQLite itself, which is cheaper
+        than allocating and binding a datetime per insert.
+        """
+        return (
+            migration.version,
+            migration.name,
+            migration.description,
+            migration.checksum,
+        )
+
+    async def mark_migration_applied(self, migration: Migration, commit: bool = True):
+        """
+        Mark a single migration as applied
+
+        run_pending_migrations batches its tracking inserts via
+        _flush_applied_rows; this remains for marking one migration in
+        isolation.
+
+        Args:
+            migration: The migration to record
+            commit: Commit immediately. Pass False when the caller already
+                holds an open transaction
+        """
         await self.db.execute(
             """
-            INSERT INTO _migrations (version, name, description, applied_at)
+            INSERT INTO _migrations (version, name, description, checksum)
             VALUES (?, ?, ?, ?)
             """,
-            (migration.version, migration.name, migration.description, datetime.now()),
+            self._build_applied_row(migration),
         )
-        await self.db.commit()
+        await self._bump_schema_token()
+        if commit:
+            await self.db.commit()
+        if self._applied_cache is not None:
+            self._applied_cache.add(migration.version)
         logger.info(
-            f"Marked migration as applied: {migration.version} - {migration.name}"
+            "Marked migration as applied: %s - %s", migration.version, migration.name
         )
 
+    async def _flush_applied_rows(self, applied_rows: List[tuple]):
+        """
+        Record a batch of applied migrations in one round-trip
+
+        One executemany + one commit replaces an INSERT + fsync per
+        migration when several apply in a single pass.
+        """
+        if not applied_rows:
+            return
+        await self.db.execute_many(
+            """
+            INSERT INTO _migrations (version, name, description, checksum)
+            VALUES (?, ?, ?, ?)
+            """,
+            applied_rows,
+        )
+        await self._bump_schema_token()
+        await self.db.commit()
+        if self._applied_cache is not None:
+            self._applied_cache.update(row[0] for row in applied_rows)
+
+    async def _bump_schema_token(self):
+        """
+        Rotate the schema version token in session_config
+
+        The token lets callers (e.g. migration_runner.get_schema_version)
+        cache derived schema information and cheaply detect staleness.
+        """
+        try:
+            await self.db.execute(
+                """
+                INSERT INTO session_config (key, value)
+                VALUES ('schema_version_tok', ?)
+                ON CONFLICT(key) DO UPDATE
+                SET value = excluded.value, updated_at = CURRENT_TIMESTAMP
+                """,
+                (uuid.uuid4().hex,),
+            )
+        except Exception as e:
+            # session_config may not exist yet (e.g. before the initial
+            # schema migration has run); caches simply miss in that case
+            logger.debug("Could not bump schema token: %s", e)
+
+    async def _verify_applied_checksums(self, applied: set):
+        """
+        Compare registered migrations' checksums against recorded ones
+
+        A mismatch means a migration file was edited after it ran; that
+        is logged as a warning rather than treated as pending, since
+        re-running it against the live schema is rarely safe.
+        """
+        with_checksum = [
+            m for m in self.migrations if m.checksum and m.version in applied
+        ]
+        if not with_checksum:
+            return
+
+        try:
+            rows = await self.db.fetch_all(
+                "SELECT version, checksum FROM _migrations"
+            )
+            recorded = dict(rows)
+        except Exception as e:
+            logger.debug("Could not read migration checksums: %s", e)
+            return
+
+        for migration in with_checksum:
+            stored = recorded.get(migration.version)
+            if stored and stored != migration.checksum:
+                logger.warning(
+                    "Checksum mismatch for applied migration %s - %s: "
+                    "source changed after it was applied",
+                    migration.version,
+                    migration.name,
+                )
+
     async def is_migration_applied(self, version: str) -> bool:
         """Check if a specific migration has been applied"""
-        result = await self.db.fetch_one(
-            "SELECT version FROM _migrations WHERE version = ?", (version,)
-        )
-        return result is not None
+        applied = await self._load_applied_cache()
+        return version in applied
 
     def register_migration(self, migration: Migration):
-        """Register a migration to be tracked"""
-        self.migrations.append(migration)
-        # Keep migrations sorted by version
-        self.migrations.sort(key=lambda m: m.version)
+        """
+        Register a migration to be tracked, keeping version order
+
+        Registration is idempotent: _register_all_migrations runs on
+        every run_migrations/get_migration_status call, so a version
+        that is already registered is silently skipped instead of
+        accumulating duplicates.
+        """
+        # Binary-search insertion keeps the list sorted without the
+        # full re-sort the old append-then-sort approach paid per call
+        idx = bisect.bisect_left(self._versions, migration.version)
+        if idx < len(self._versions) and self._versions[idx] == migration.version:
+            return
+        self._versions.insert(idx, migration.version)
+        self.migrations.insert(idx, migration)
+        self._by_version[migration.version] = migration
+
+    def _topological_levels(self) -> List[List[Migration]]:
+        """
+        Group migrations into dependency frontiers (Kahn levels)
+
+        Each level contains migrations that depend only on earlier
+        levels, sorted by version for determinism. Migrations within a
+        level are mutually independent, so a backend with concurrent
+        DDL support could apply a whole level at once.
+
+        Raises:
+            ValueError: If the dependency graph contains a cycle
+        """
+        by_version = self._by_version
+        indegree = {m.version: 0 for m in self.migrations}
+        dependents: Dict[str, List[str]] = {m.version: [] for m in self.migrations}
+
+        for migration in self.migrations:
+            for dep in migration.depends_on:
+                if dep in by_version:
+                    dependents[dep].append(migration.version)
+                    indegree[migration.version] += 1
+
+        frontier = sorted(v for v, d in indegree.items() if d == 0)
+
+        levels = []
+        emitted = 0
+        while frontier:
+            levels.append([by_version[version] for version in frontier])
+            emitted += len(frontier)
+            next_frontier = []
+            for version in frontier:
+                for dependent in dependents[version]:
+                    indegree[dependent] -= 1
+                    if indegree[dependent] == 0:
+                        next_frontier.append(dependent)
+            frontier = sorted(next_frontier)
+
+        # Compare against the version map, not the raw list: repeated
+        # registration of the same migration must not look like a cycle
+        if emitted != len(by_version):
+            unresolved = sorted(v for v, d in indegree.items() if d > 0)
+            raise ValueError(
+                f"Migration dependency cycle detected involving: {unresolved}"
+            )
+
+        return levels
+
+    def _topological_order(self) -> List[Migration]:
+        """
+        Order migrations by explicit depends_on edges, breaking ties by
+        version string
+
+        Plain lexicographic ordering cannot express cross-file
+        dependencies and misorders versions like "9" vs "010".
+
+        Raises:
+            ValueError: If the dependency graph contains a cycle
+        """
+        # Flattening the Kahn levels preserves dependency order. SQLite
+        # has a single writer, so the levels are applied sequentially;
+        # gathering within a level only pays off on backends with
+        # concurrent DDL
+        return [m for level in self._topological_levels() for m in level]
 
     async def run_pending_migrations(self) -> bool:
         """Run all pending migrations that haven't been applied yet"""
@@ -100,51 +348,93 @@ class MigrationManager:
             # Ensure migrations table exists
             await self.init_migrations_table()
 
-            # Get applied migrations
-            applied = await self.get_applied_migrations()
+            # Get applied migrations (cached set: one SELECT per manager)
+            applied = await self._load_applied_cache()
+
+            # Find pending migrations in dependency order
+            pending = [
+                m for m in self._topological_order() if m.version not in applied
+            ]
 
-            # Find pending migrations
-            pending = [m for m in self.migrations if m.version not in applied]
+            # Warn when an applied migration's SQL no longer matches the
+            # checksum recorded at apply time (edited after the fact)
+            await self._verify_applied_checksums(applied)
 
             if not pending:
                 logger.info("No pending migrations to run")
                 return True
 
-            logger.info(f"Found {len(pending)} pending migration(s) to run")
-
-            # Run each pending migration
-            for migration in pending:
-                logger.info(
-                    f"Running migration: {migration.version} - {migration.name}"
-                )
-
-                try:
-                    # Execute the migration
-                    await migration.up(self.db)
-
-                    # Mark as applied
-                    await self.mark_migration_applied(migration)
+            logger.info("Found %s pending migration(s) to run", len(pending))
 
+            # Run each pending migration, collecting tracking rows so
+            # they can be recorded in one executemany at the end
+            applied_rows: List[tuple] = []
+            try:
+                for migration in pending:
                     logger.info(
-                        f"✓ Successfully applied migration: {migration.version}"
+                        "Running migration: %s - %s", migration.version, migration.name
                     )
 
-                except Exception as e:
-                    logger.error(
-                        f"✗ Failed to apply migration {migration.version}: {e}"
-                    )
-                    # Don't mark as applied, will retry next time
-                    raise
-
-            logger.info(f"All migrations completed successfully")
+                    try:
+                        # One transaction per migration so its DDL lands
+                        # in a single WAL commit (one fsync)
+                        await self.db.execute("BEGIN")
+
+                        # Execute the migration
+                        await migration.up(self.db)
+
+                        # Migrations that use executescript() implicitly
+                        # end the transaction; only COMMIT when one is
+                        # still open
+                        conn = await self.db.get_connection()
+                        if conn.in_transaction:
+                            await self.db.execute("COMMIT")
+
+                        applied_rows.append(self._build_applied_row(migration))
+
+                        logger.info(
+                            "✓ Successfully applied migration: %s", migration.version
+                        )
+
+                    except Exception as e:
+                        logger.error(
+                            "✗ Failed to apply migration %s: %s", migration.version, e
+                        )
+                        # Don't mark as applied, will retry next time
+                        try:
+                            await self.db.rollback()
+                        except Exception:
+                            pass
+                        raise
+            finally:
+                # Record everything that did succeed, even when a later
+                # migration failed, so successful ones don't re-run
+                await self._flush_applied_rows(applied_rows)
+
+            logger.info("All migrations completed successfully")
             return True
 
         except Exception as e:
-            logger.error(f"Error running migrations: {e}")
+            logger.error("Error running migrations: %s", e)
             return False
 
     async def get_migration_status(self) -> List[Dict]:
         """Get status of all registered migrations"""
+        # Cheap one-row probe as the cache key: the full status only
+        # needs rebuilding when the applied set or registrations change
+        try:
+            row = await self.db.fetch_one(
+                "SELECT COUNT(*), MAX(applied_at) FROM _migrations"
+            )
+            cache_key = (row[0], row[1], len(self.migrations)) if row else None
+        except Exception:
+            cache_key = None
+
+        if cache_key is not None and self._status_cache is not None:
+            cached_key, cached_status = self._status_cache
+            if cached_key == cache_key:
+                return cached_status
+
         applied = await self.get_applied_migrations()
 
         status = []
@@ -159,6 +449,9 @@ class MigrationManager:
                 }
             )
 
+        if cache_key is not None:
+            self._status_cache = (cache_key, status)
+
         return status
 
     async def rollback_last_migration(self) -> bool:
@@ -175,14 +468,14 @@ class MigrationManager:
 
             version = row[0]
 
-            # Find the migration
-            migration = next((m for m in self.migrations if m.version == version), None)
+            # Find the migration (O(1) map lookup instead of a scan)
+            migration = self._by_version.get(version)
 
             if not migration:
-                logger.error(f"Migration {version} not found in registered migrations")
+                logger.error("Migration %s not found in registered migrations", version)
                 return False
 
-            logger.info(f"Rolling back migration: {version} - {migration.name}")
+            logger.info("Rolling back migration: %s - %s", version, migration.name)
 
             # Execute rollback
             await migration.down(self.db)
@@ -191,13 +484,16 @@ class MigrationManager:
             await self.db.execute(
                 "DELETE FROM _migrations WHERE version = ?", (version,)
             )
+            await self._bump_schema_token()
             await self.db.commit()
+            if self._applied_cache is not None:
+                self._applied_cache.discard(version)
 
-            logger.info(f"✓ Successfully rolled back migration: {version}")
+            logger.info("✓ Successfully rolled back migration: %s", version)
             return True
 
         except Exception as e:
-            logger.error(f"Error rolling back migration: {e}")
+            logger.error("Error rolling back migration: %s", e)
             return False
 
 
@@ -225,9 +521,17 @@ def _register_all_migrations(manager: MigrationManager):
     """
     # Import and register all migration files
     from . import migration_001_initial_schema
+    from . import migration_007_contacts_fts
+    from . import migration_008_tags_name_index
+    from . import migration_009_messages_epoch_micros
 
     # Register migrations
     manager.register_migration(migration_001_initial_schema.InitialSchemaMigration())
+    manager.register_migration(migration_007_contacts_fts.ContactsFtsMigration())
+    manager.register_migration(migration_008_tags_name_index.TagsNameIndexMigration())
+    manager.register_migration(
+        migration_009_messages_epoch_micros.MessagesEpochMicrosMigration()
+    )
 
     # Add new migrations here as you create them:
     # from . import migration_002_your_migration
@@ -247,6 +551,22 @@ async def run_migrations(db: DatabaseConnection) -> bool:
     """
     logger.info("Starting migration process...")
 
+    # DatabaseConnection.connect() already applies these, but migrations
+    # may be driven over a connection configured elsewhere; re-asserting
+    # the write-path pragmas is a few cheap statements and ensures DDL
+    # batches group-commit under WAL instead of fsyncing per statement
+    try:
+        await db.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA cache_size = -65536;
+            """
+        )
+    except Exception as e:
+        logger.debug("Could not apply migration pragmas: %s", e)
+
     manager = get_migration_manager(db)
 
     # Register all migrations
@@ -294,10 +614,19 @@ async def verify_schema(db: DatabaseConnection) -> bool:
         "sync_log",
     ]
 
-    for table in required_tables:
-        if not await db.table_exists(table):
-            logger.error(f"Required table missing: {table}")
-            return False
+    # One sqlite_master query for all tables instead of a round-trip per
+    # table; the set difference happens in Python
+    placeholders = ",".join("?" * len(required_tables))
+    rows = await db.fetch_all(
+        f"SELECT name FROM sqlite_master WHERE type='table' AND name IN ({placeholders})",
+        tuple(required_tables),
+    )
+    missing = set(required_tables) - {row[0] for row in rows}
+
+    for table in sorted(missing):
+        logger.error("Required table missing: %s", table)
+    if missing:
+        return False
 
     logger.info("Database schema verification passed")
     return True
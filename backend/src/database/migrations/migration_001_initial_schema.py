@@ -1,6 +1,6 @@
 """
 Migration 001: Initial Schema
-Creates the base database schema with all tables, indexes, and triggers
+Creates the base database schema with all tables and indexes
 """
 
 import logging
@@ -10,6 +10,185 @@ from ..connection import DatabaseConnection
 logger = logging.getLogger(__name__)
 
 
+# Index definitions: (index name, table, column spec)
+#
+# Columns declared UNIQUE already get an implicit SQLite index, so no
+# explicit index is created for contacts.telegram_id, groups.telegram_id
+# or tags.name — duplicating them would only grow the file and slow
+# writes without helping any query
+_INDEXES = (
+    ("idx_contacts_username", "contacts", "username"),
+    ("idx_contacts_display_name", "contacts", "display_name"),
+    ("idx_groups_name", "groups", "name"),
+    # Composite index serves both the FK lookup on contact_id (prefix)
+    # and the hot "latest messages for a contact" ordering, so no
+    # separate index on contact_id alone is needed
+    ("idx_messages_contact_timestamp", "messages", "contact_id, timestamp DESC"),
+    ("idx_messages_timestamp", "messages", "timestamp DESC"),
+    ("idx_messages_is_outgoing", "messages", "is_outgoing"),
+    # Junction tables are WITHOUT ROWID, so the composite PK B-tree
+    # itself serves contact_id-prefix lookups; only the reverse
+    # direction needs an explicit index, spelled out as the full
+    # composite so both join directions are covering index-only scans
+    ("idx_contact_tags_tag_contact", "contact_tags", "tag_id, contact_id"),
+    ("idx_contact_groups_group_contact", "contact_groups", "group_id, contact_id"),
+    ("idx_sync_log_sync_type", "sync_log", "sync_type"),
+    ("idx_sync_log_status", "sync_log", "status"),
+)
+
+# One named constant per table: compiled once at import, referenced by
+# name from up() and easy to reuse individually from other migrations
+_CREATE_CONTACTS_SQL = """
+    CREATE TABLE IF NOT EXISTS contacts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        telegram_id INTEGER UNIQUE NOT NULL,
+        username TEXT,
+        first_name TEXT,
+        last_name TEXT,
+        display_name TEXT NOT NULL,
+        phone TEXT,
+        profile_photo_path TEXT,
+        bio TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+
+_CREATE_GROUPS_SQL = """
+    CREATE TABLE IF NOT EXISTS groups (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        telegram_id INTEGER UNIQUE NOT NULL,
+        name TEXT NOT NULL,
+        member_count INTEGER DEFAULT 0,
+        profile_photo_path TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+
+_CREATE_TAGS_SQL = """
+    CREATE TABLE IF NOT EXISTS tags (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE NOT NULL,
+        color TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+
+# Junction tables are WITHOUT ROWID: rows live directly in the composite
+# PK B-tree instead of a hidden rowid tree plus a separate PK index,
+# which shrinks storage and halves the I/O on join lookups
+_CREATE_CONTACT_TAGS_SQL = """
+    CREATE TABLE IF NOT EXISTS contact_tags (
+        contact_id INTEGER NOT NULL,
+        tag_id INTEGER NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (contact_id, tag_id),
+        FOREIGN KEY (contact_id) REFERENCES contacts(id) ON DELETE CASCADE,
+        FOREIGN KEY (tag_id) REFERENCES tags(id) ON DELETE CASCADE
+    ) WITHOUT ROWID;
+"""
+
+_CREATE_CONTACT_GROUPS_SQL = """
+    CREATE TABLE IF NOT EXISTS contact_groups (
+        contact_id INTEGER NOT NULL,
+        group_id INTEGER NOT NULL,
+        joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (contact_id, group_id),
+        FOREIGN KEY (contact_id) REFERENCES contacts(id) ON DELETE CASCADE,
+        FOREIGN KEY (group_id) REFERENCES groups(id) ON DELETE CASCADE
+    ) WITHOUT ROWID;
+"""
+
+# timestamp is stored as unix epoch microseconds (INTEGER) rather than
+# an ISO-8601 TEXT value: ORDER BY becomes an integer comparison instead
+# of a string compare, and the timestamp indexes shrink to 8-byte keys.
+# The Message model converts to datetime at the edge
+_CREATE_MESSAGES_SQL = """
+    CREATE TABLE IF NOT EXISTS messages (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        telegram_message_id INTEGER,
+        contact_id INTEGER NOT NULL,
+        is_outgoing BOOLEAN NOT NULL,
+        content TEXT,
+        timestamp INTEGER NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (contact_id) REFERENCES contacts(id) ON DELETE CASCADE
+    );
+"""
+
+_CREATE_SESSION_CONFIG_SQL = """
+    CREATE TABLE IF NOT EXISTS session_config (
+        key TEXT PRIMARY KEY,
+        value TEXT,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+
+_CREATE_SYNC_LOG_SQL = """
+    CREATE TABLE IF NOT EXISTS sync_log (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        sync_type TEXT NOT NULL,
+        status TEXT NOT NULL,
+        records_processed INTEGER DEFAULT 0,
+        error_message TEXT,
+        started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        completed_at TIMESTAMP
+    );
+"""
+
+_TABLES_SQL = (
+    _CREATE_CONTACTS_SQL
+    + _CREATE_GROUPS_SQL
+    + _CREATE_TAGS_SQL
+    + _CREATE_CONTACT_TAGS_SQL
+    + _CREATE_CONTACT_GROUPS_SQL
+    + _CREATE_MESSAGES_SQL
+    + _CREATE_SESSION_CONFIG_SQL
+    + _CREATE_SYNC_LOG_SQL
+)
+
+# No update-timestamp triggers: each AFTER UPDATE trigger re-issued an
+# UPDATE per modified row, doubling write amplification on the busiest
+# write paths. updated_at is maintained by the writers instead — the
+# ORM models via onupdate, raw-SQL updates by setting the column in the
+# statement itself
+
+# Index DDL rendered once at import; the tuple keeps the individual
+# statements addressable while the joined script feeds executescript
+_INDEX_DDL = tuple(
+    f"CREATE INDEX IF NOT EXISTS {name} ON {table}({column_spec});"
+    for name, table, column_spec in _INDEXES
+)
+
+# Full schema assembled once at import: tables, then indexes
+_INITIAL_SCHEMA_SQL = _TABLES_SQL + "\n".join(_INDEX_DDL)
+
+_DROP_INDEX_SQL = "\n".join(f"DROP INDEX IF EXISTS {name};" for name, _, _ in _INDEXES)
+
+
+async def create_indexes(db: DatabaseConnection):
+    """
+    (Re)create all schema indexes in one executescript call
+
+    Idempotent (IF NOT EXISTS). Pairs with drop_indexes for bulk loads:
+    building an index once over a populated table is much cheaper than
+    maintaining it row by row during the load.
+    """
+    await db.executescript("\n".join(_INDEX_DDL))
+
+
+async def drop_indexes(db: DatabaseConnection):
+    """
+    Drop all schema indexes ahead of a bulk load
+
+    Call create_indexes afterwards to rebuild them in a single pass.
+    Only the explicit indexes are dropped; implicit UNIQUE indexes
+    cannot be removed and keep enforcing constraints during the load.
+    """
+    await db.executescript(_DROP_INDEX_SQL)
+
+
 class InitialSchemaMigration(Migration):
     """Initial database schema migration"""
 
@@ -18,196 +197,29 @@ class InitialSchemaMigration(Migration):
             version="001",
             name="initial_schema",
             description="Create base database schema with contacts, groups, tags, messages, and configuration tables",
+            sql_body=_INITIAL_SCHEMA_SQL,
         )
 
     async def up(self, db: DatabaseConnection):
-        """Create all initial tables, indexes, and triggers"""
+        """Create all initial tables and indexes"""
         logger.info("Creating initial database schema...")
 
-        # Create contacts table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS contacts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                telegram_id INTEGER UNIQUE NOT NULL,
-                username TEXT,
-                first_name TEXT,
-                last_name TEXT,
-                display_name TEXT NOT NULL,
-                phone TEXT,
-                profile_photo_path TEXT,
-                bio TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-        logger.info("Created table: contacts")
-
-        # Create groups table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS groups (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                telegram_id INTEGER UNIQUE NOT NULL,
-                name TEXT NOT NULL,
-                member_count INTEGER DEFAULT 0,
-                profile_photo_path TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-        logger.info("Created table: groups")
-
-        # Create tags table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS tags (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT UNIQUE NOT NULL,
-                color TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-        logger.info("Created table: tags")
-
-        # Create contact_tags junction table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS contact_tags (
-                contact_id INTEGER NOT NULL,
-                tag_id INTEGER NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                PRIMARY KEY (contact_id, tag_id),
-                FOREIGN KEY (contact_id) REFERENCES contacts(id) ON DELETE CASCADE,
-                FOREIGN KEY (tag_id) REFERENCES tags(id) ON DELETE CASCADE
-            );
-        """)
-        logger.info("Created table: contact_tags")
-
-        # Create contact_groups junction table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS contact_groups (
-                contact_id INTEGER NOT NULL,
-                group_id INTEGER NOT NULL,
-                joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                PRIMARY KEY (contact_id, group_id),
-                FOREIGN KEY (contact_id) REFERENCES contacts(id) ON DELETE CASCADE,
-                FOREIGN KEY (group_id) REFERENCES groups(id) ON DELETE CASCADE
-            );
-        """)
-        logger.info("Created table: contact_groups")
-
-        # Create messages table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS messages (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                telegram_message_id INTEGER,
-                contact_id INTEGER NOT NULL,
-                is_outgoing BOOLEAN NOT NULL,
-                content TEXT,
-                timestamp TIMESTAMP NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (contact_id) REFERENCES contacts(id) ON DELETE CASCADE
-            );
-        """)
-        logger.info("Created table: messages")
-
-        # Create session_config table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS session_config (
-                key TEXT PRIMARY KEY,
-                value TEXT,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-        logger.info("Created table: session_config")
-
-        # Create sync_log table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS sync_log (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                sync_type TEXT NOT NULL,
-                status TEXT NOT NULL,
-                records_processed INTEGER DEFAULT 0,
-                error_message TEXT,
-                started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                completed_at TIMESTAMP
-            );
-        """)
-        logger.info("Created table: sync_log")
-
-        # Create indexes for performance
-        logger.info("Creating indexes...")
-
-        indexes = [
-            ("idx_contacts_telegram_id", "contacts", "telegram_id"),
-            ("idx_contacts_username", "contacts", "username"),
-            ("idx_contacts_display_name", "contacts", "display_name"),
-            ("idx_groups_telegram_id", "groups", "telegram_id"),
-            ("idx_groups_name", "groups", "name"),
-            ("idx_messages_contact_id", "messages", "contact_id"),
-            ("idx_messages_timestamp", "messages", "timestamp DESC"),
-            ("idx_messages_is_outgoing", "messages", "is_outgoing"),
-            ("idx_contact_tags_tag_id", "contact_tags", "tag_id"),
-            ("idx_contact_tags_contact_id", "contact_tags", "contact_id"),
-            ("idx_contact_groups_group_id", "contact_groups", "group_id"),
-            ("idx_contact_groups_contact_id", "contact_groups", "contact_id"),
-            ("idx_tags_name", "tags", "name"),
-            ("idx_sync_log_sync_type", "sync_log", "sync_type"),
-            ("idx_sync_log_status", "sync_log", "status"),
-        ]
-
-        for index_name, table_name, column_spec in indexes:
-            await db.execute(
-                f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name}({column_spec});"
-            )
-
-        logger.info(f"Created {len(indexes)} indexes")
-
-        # Create triggers for automatic timestamp updates
-        logger.info("Creating triggers...")
-
-        # Contacts update trigger
-        await db.execute("""
-            CREATE TRIGGER IF NOT EXISTS update_contacts_timestamp
-            AFTER UPDATE ON contacts
-            FOR EACH ROW
-            BEGIN
-                UPDATE contacts SET updated_at = CURRENT_TIMESTAMP
-                WHERE id = NEW.id;
-            END;
-        """)
-
-        # Groups update trigger
-        await db.execute("""
-            CREATE TRIGGER IF NOT EXISTS update_groups_timestamp
-            AFTER UPDATE ON groups
-            FOR EACH ROW
-            BEGIN
-                UPDATE groups SET updated_at = CURRENT_TIMESTAMP
-                WHERE id = NEW.id;
-            END;
-        """)
-
-        # Session config update trigger
-        await db.execute("""
-            CREATE TRIGGER IF NOT EXISTS update_session_config_timestamp
-            AFTER UPDATE ON session_config
-            FOR EACH ROW
-            BEGIN
-                UPDATE session_config SET updated_at = CURRENT_TIMESTAMP
-                WHERE key = NEW.key;
-            END;
-        """)
-
-        logger.info("Created 3 triggers")
-
-        # Commit all changes
-        await db.commit()
+        # One executescript call replaces ~26 per-statement awaits; the
+        # whole schema lands in a single round-trip to SQLite
+        await db.executescript(_INITIAL_SCHEMA_SQL)
 
-        logger.info("✓ Initial schema created successfully")
+        logger.info(
+            "✓ Initial schema created successfully "
+            "(8 tables, %d indexes)",
+            len(_INDEXES),
+        )
 
     async def down(self, db: DatabaseConnection):
         """Drop all tables created by this migration"""
         logger.warning("Rolling back initial schema (dropping all tables)...")
 
-        # Drop tables in reverse order of dependencies
+        # Drop tables in reverse order of dependencies, in one script
+        # instead of one await per table
         tables = [
             "contact_tags",
             "contact_groups",
@@ -219,10 +231,12 @@ class InitialSchemaMigration(Migration):
             "contacts",
         ]
 
-        for table in tables:
-            await db.execute(f"DROP TABLE IF EXISTS {table}")
-            logger.info(f"Dropped table: {table}")
+        await db.executescript(
+            "\n".join(f"DROP TABLE IF EXISTS {table};" for table in tables)
+        )
+        logger.info("Dropped tables: %s", ", ".join(tables))
 
+        db.invalidate_table_cache()
         await db.commit()
 
         logger.warning("✓ Initial schema rolled back successfully")
@@ -33,20 +33,8 @@ class TagRepositoryMigration(Migration):
         - Foreign key constraints with CASCADE delete
         - Indexes on name, contact_id, and tag_id
         """
-        logger.info("Verifying Tag Repository schema...")
-
-        # Verify tags table exists
-        tags_exists = await db.table_exists("tags")
-        if not tags_exists:
-            raise Exception("tags table does not exist. Run migration_001 first.")
-
-        # Verify contact_tags junction table exists
-        contact_tags_exists = await db.table_exists("contact_tags")
-        if not contact_tags_exists:
-            raise Exception(
-                "contact_tags table does not exist. Run migration_001 first."
-            )
-
+        # No runtime pre-check: migrations run in version order, so
+        # migration_001 guarantees tags and contact_tags exist here
         logger.info("✓ Tag Repository schema verified")
 
         # Log implementation details
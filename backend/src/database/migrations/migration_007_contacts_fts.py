@@ -0,0 +1,105 @@
+"""
+Migration 007: Contacts Full-Text Search
+Creates an FTS5 index over the searchable contact columns
+
+Contact search previously scanned the whole table with six LIKE
+predicates per row. FTS5 maintains an inverted index over the same
+columns, turning search into an index probe with BM25 ranking.
+"""
+
+import logging
+from . import Migration
+from ..connection import DatabaseConnection
+
+logger = logging.getLogger(__name__)
+
+
+# Columns mirrored into the FTS index, in table order
+_FTS_COLUMNS = (
+    "username",
+    "first_name",
+    "last_name",
+    "display_name",
+    "phone",
+    "bio",
+)
+
+_COLS = ", ".join(_FTS_COLUMNS)
+_NEW_COLS = ", ".join(f"new.{col}" for col in _FTS_COLUMNS)
+_OLD_COLS = ", ".join(f"old.{col}" for col in _FTS_COLUMNS)
+
+# External-content table: the index stores only tokens and rowids while
+# column values stay in contacts, so the FTS table adds no row storage.
+# The triggers keep the index in sync with every write path, ORM or raw.
+# The backfill uses the FTS5 'rebuild' command rather than an
+# INSERT ... SELECT: rebuild repopulates the index from the content
+# table from scratch, so re-running the script (e.g. after a tracking
+# insert failed) cannot leave duplicate index entries behind
+_CONTACTS_FTS_SQL = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS contacts_fts USING fts5(
+        {_COLS},
+        content='contacts',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS contacts_fts_ai AFTER INSERT ON contacts
+    BEGIN
+        INSERT INTO contacts_fts(rowid, {_COLS})
+        VALUES (new.id, {_NEW_COLS});
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS contacts_fts_ad AFTER DELETE ON contacts
+    BEGIN
+        INSERT INTO contacts_fts(contacts_fts, rowid, {_COLS})
+        VALUES ('delete', old.id, {_OLD_COLS});
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS contacts_fts_au AFTER UPDATE ON contacts
+    BEGIN
+        INSERT INTO contacts_fts(contacts_fts, rowid, {_COLS})
+        VALUES ('delete', old.id, {_OLD_COLS});
+        INSERT INTO contacts_fts(rowid, {_COLS})
+        VALUES (new.id, {_NEW_COLS});
+    END;
+
+    INSERT INTO contacts_fts(contacts_fts) VALUES ('rebuild');
+"""
+
+_DROP_FTS_SQL = """
+    DROP TRIGGER IF EXISTS contacts_fts_ai;
+    DROP TRIGGER IF EXISTS contacts_fts_ad;
+    DROP TRIGGER IF EXISTS contacts_fts_au;
+    DROP TABLE IF EXISTS contacts_fts;
+"""
+
+
+class ContactsFtsMigration(Migration):
+    """Full-text search index for contacts"""
+
+    def __init__(self):
+        super().__init__(
+            version="007",
+            name="contacts_fts",
+            description="Create FTS5 index and sync triggers for contact search",
+            depends_on=["001"],
+            sql_body=_CONTACTS_FTS_SQL,
+        )
+
+    async def up(self, db: DatabaseConnection):
+        """Create the FTS table, sync triggers, and backfill existing rows"""
+        logger.info("Creating contacts full-text search index...")
+
+        await db.executescript(_CONTACTS_FTS_SQL)
+
+        logger.info("✓ contacts_fts created and backfilled")
+
+    async def down(self, db: DatabaseConnection):
+        """Drop the FTS table and its sync triggers"""
+        logger.warning("Dropping contacts full-text search index...")
+
+        await db.executescript(_DROP_FTS_SQL)
+        db.invalidate_table_cache()
+        await db.commit()
+
+        logger.warning("✓ contacts_fts dropped")
@@ -0,0 +1,56 @@
+"""
+Migration 008: Functional index on lower(tags.name)
+Lets case-insensitive tag lookups seek instead of scan
+
+TagRepository.get_by_name and exists_by_name filter on
+lower(name) = lower(:name); without a matching expression index SQLite
+evaluates lower() per row across the whole table. The index turns the
+predicate into a single probe and enforces case-insensitive uniqueness,
+matching the semantics of Tag.__eq__ / __hash__.
+"""
+
+import logging
+from . import Migration
+from ..connection import DatabaseConnection
+
+logger = logging.getLogger(__name__)
+
+
+_TAGS_NAME_INDEX_SQL = """
+    CREATE UNIQUE INDEX IF NOT EXISTS tags_name_lower_idx
+        ON tags (lower(name));
+"""
+
+_DROP_TAGS_NAME_INDEX_SQL = """
+    DROP INDEX IF EXISTS tags_name_lower_idx;
+"""
+
+
+class TagsNameIndexMigration(Migration):
+    """Case-insensitive unique index on tag names"""
+
+    def __init__(self):
+        super().__init__(
+            version="008",
+            name="tags_name_index",
+            description="Create unique functional index on lower(tags.name)",
+            depends_on=["001"],
+            sql_body=_TAGS_NAME_INDEX_SQL,
+        )
+
+    async def up(self, db: DatabaseConnection):
+        """Create the functional index over existing tag names"""
+        logger.info("Creating tags lower(name) index...")
+
+        await db.executescript(_TAGS_NAME_INDEX_SQL)
+
+        logger.info("✓ tags_name_lower_idx created")
+
+    async def down(self, db: DatabaseConnection):
+        """Drop the functional index"""
+        logger.warning("Dropping tags lower(name) index...")
+
+        await db.executescript(_DROP_TAGS_NAME_INDEX_SQL)
+        await db.commit()
+
+        logger.warning("✓ tags_name_lower_idx dropped")
@@ -0,0 +1,87 @@
+"""
+Migration 009: Convert legacy message timestamps to epoch microseconds
+Rewrites ISO-8601 TEXT values left by the pre-retype schema
+
+Migration 001 declares messages.timestamp as INTEGER epoch
+microseconds, but databases created before the retype still hold the
+original ISO-8601 TEXT values; the read paths divide the column by
+1_000_000 and crash on those rows. This migration rewrites any
+remaining TEXT timestamps in place so every database matches what the
+code assumes, then rebuilds the timestamp indexes over the new keys.
+"""
+
+import logging
+from . import Migration
+from ..connection import DatabaseConnection
+
+logger = logging.getLogger(__name__)
+
+
+# Whole seconds come from strftime('%s') (exact), the sub-second part
+# from the fraction digits in the string itself, right-padded to six
+# places — unlike julianday()-based arithmetic this loses no precision.
+# Rows that are already INTEGER (typeof check) or unparseable (strftime
+# NULL check) are left untouched. The REINDEXes are belt-and-braces:
+# the UPDATE maintains the index B-trees, but rebuilding them packs the
+# pages around the new 8-byte integer keys
+_MESSAGES_EPOCH_MICROS_SQL = """
+    UPDATE messages
+    SET timestamp =
+        CAST(strftime('%s', timestamp) AS INTEGER) * 1000000
+        + CASE WHEN instr(timestamp, '.') > 0
+            THEN CAST(
+                substr(
+                    substr(timestamp, instr(timestamp, '.') + 1) || '000000',
+                    1, 6
+                ) AS INTEGER
+            )
+            ELSE 0
+        END
+    WHERE typeof(timestamp) = 'text'
+      AND strftime('%s', timestamp) IS NOT NULL;
+
+    REINDEX idx_messages_contact_timestamp;
+    REINDEX idx_messages_timestamp;
+"""
+
+# Lossy below the millisecond: %f formats three fraction digits
+_MESSAGES_ISO_TEXT_SQL = """
+    UPDATE messages
+    SET timestamp = strftime(
+        '%Y-%m-%d %H:%M:%f', timestamp / 1000000.0, 'unixepoch'
+    )
+    WHERE typeof(timestamp) IN ('integer', 'real');
+
+    REINDEX idx_messages_contact_timestamp;
+    REINDEX idx_messages_timestamp;
+"""
+
+
+class MessagesEpochMicrosMigration(Migration):
+    """Rewrite legacy TEXT message timestamps as epoch microseconds"""
+
+    def __init__(self):
+        super().__init__(
+            version="009",
+            name="messages_epoch_micros",
+            description="Convert legacy TEXT message timestamps to "
+            "INTEGER epoch microseconds",
+            depends_on=["001"],
+            sql_body=_MESSAGES_EPOCH_MICROS_SQL,
+        )
+
+    async def up(self, db: DatabaseConnection):
+        """Rewrite TEXT timestamps in place and rebuild their indexes"""
+        logger.info("Converting legacy message timestamps to epoch micros...")
+
+        await db.executescript(_MESSAGES_EPOCH_MICROS_SQL)
+
+        logger.info("✓ messages.timestamp converted to epoch microseconds")
+
+    async def down(self, db: DatabaseConnection):
+        """Convert timestamps back to ISO-8601 text (millisecond precision)"""
+        logger.warning("Converting message timestamps back to ISO text...")
+
+        await db.executescript(_MESSAGES_ISO_TEXT_SQL)
+
+        logger.warning("✓ messages.timestamp converted back to ISO text")
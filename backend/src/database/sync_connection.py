@@ -0,0 +1,212 @@
+"""
+Synchronous Database Connection
+Provides a plain sqlite3-backed counterpart to DatabaseConnection for
+single-shot CLI workflows
+
+aiosqlite runs every statement on a private worker thread, so each query
+pays two thread context switches. For sequential command-line tools there
+is no concurrency to exploit; going through sqlite3 directly removes the
+thread hops entirely.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Optional
+from contextlib import contextmanager
+import logging
+
+from src.config import get_settings, ensure_directories_exist
+from .connection import CACHED_STATEMENTS
+
+logger = logging.getLogger(__name__)
+
+
+class SyncDatabase:
+    """
+    Synchronous SQLite connection with the same method surface as
+    DatabaseConnection (execute, fetch_one, fetch_all, ...)
+
+    Intended for single-shot CLI commands; long-running async code
+    should keep using DatabaseConnection.
+    """
+
+    def __init__(self, database_path: str):
+        """
+        Initialize synchronous database connection manager
+
+        Args:
+            database_path: Path to SQLite database file
+        """
+        self.database_path = Path(database_path)
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Establish connection to the database
+        Creates the database file if it doesn't exist
+
+        Returns:
+            sqlite3.Connection: Active database connection
+        """
+        if self._connection is None:
+            ensure_directories_exist(self.database_path.parent)
+
+            self._connection = sqlite3.connect(
+                str(self.database_path),
+                timeout=30.0,
+                isolation_level=None,
+                cached_statements=CACHED_STATEMENTS,
+            )
+
+            # Same configuration as the async connection
+            settings = get_settings()
+            self._connection.executescript(
+                f"""
+                PRAGMA foreign_keys = ON;
+                PRAGMA journal_mode = {settings.DB_JOURNAL_MODE};
+                PRAGMA synchronous = {settings.DB_SYNCHRONOUS};
+                PRAGMA mmap_size = 268435456;
+                PRAGMA cache_size = -65536;
+                PRAGMA temp_store = MEMORY;
+                PRAGMA busy_timeout = {settings.DB_BUSY_TIMEOUT};
+                PRAGMA journal_size_limit = 67108864;
+                """
+            )
+            self._connection.commit()
+
+            logger.info(f"Connected to database (sync): {self.database_path}")
+
+        return self._connection
+
+    def disconnect(self):
+        """
+        Close the database connection
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+            logger.info("Database connection closed (sync)")
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Get active database connection, creating one if necessary
+
+        Returns:
+            sqlite3.Connection: Active database connection
+        """
+        if self._connection is not None:
+            return self._connection
+        return self.connect()
+
+    @contextmanager
+    def transaction(self, immediate: bool = True):
+        """
+        Context manager for database transactions
+        Automatically commits on success, rolls back on error
+
+        Opens with BEGIN IMMEDIATE by default, matching the async
+        connection: the write lock is taken at BEGIN rather than on the
+        first write, avoiding mid-transaction SQLITE_BUSY upgrades.
+        """
+        conn = self.get_connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            yield conn
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Transaction failed, rolling back: {e}")
+            raise
+
+    def execute(self, query: str, parameters=None):
+        """
+        Execute a single SQL statement
+
+        Args:
+            query: SQL query string
+            parameters: Query parameters (optional)
+
+        Returns:
+            Cursor object
+        """
+        conn = self.get_connection()
+        if parameters:
+            return conn.execute(query, parameters)
+        return conn.execute(query)
+
+    def execute_many(self, query: str, parameters_list):
+        """
+        Execute a SQL statement with multiple parameter sets
+
+        Args:
+            query: SQL query string
+            parameters_list: List of parameter tuples
+
+        Returns:
+            Cursor object
+        """
+        conn = self.get_connection()
+        return conn.executemany(query, parameters_list)
+
+    def fetch_one(self, query: str, parameters=None):
+        """
+        Execute query and fetch a single row
+
+        Returns:
+            Single row as tuple or None
+        """
+        return self.execute(query, parameters).fetchone()
+
+    def fetch_all(self, query: str, parameters=None):
+        """
+        Execute query and fetch all rows
+
+        Returns:
+            List of rows as tuples
+        """
+        return self.execute(query, parameters).fetchall()
+
+    def commit(self):
+        """
+        Commit current transaction
+        """
+        self.get_connection().commit()
+
+    def rollback(self):
+        """
+        Rollback current transaction
+        """
+        self.get_connection().rollback()
+
+    def table_exists(self, table_name: str) -> bool:
+        """
+        Check if a table exists in the database
+
+        Args:
+            table_name: Name of the table to check
+
+        Returns:
+            True if table exists, False otherwise
+        """
+        query = """
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name=?
+        """
+        return self.fetch_one(query, (table_name,)) is not None
+
+    def get_table_count(self, table_name: str) -> int:
+        """
+        Get row count for a table
+
+        Args:
+            table_name: Name of the table
+
+        Returns:
+            Number of rows in the table
+        """
+        result = self.fetch_one(f"SELECT COUNT(*) FROM {table_name}")
+        return result[0] if result else 0
+
+    def __repr__(self) -> str:
+        status = "connected" if self._connection else "disconnected"
+        return f"SyncDatabase(path={self.database_path}, status={status})"
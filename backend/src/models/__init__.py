@@ -10,10 +10,12 @@ from .contact import Contact
 from .group import Group
 from .tag import Tag
 from .message import Message
+from .batch import ContactBatch
 
 __all__ = [
     "Contact",
     "ContactProfile",
+    "ContactBatch",
     "Group",
     "Tag",
     "Message",
@@ -0,0 +1,105 @@
+"""
+Columnar batch model for bulk contact operations.
+
+Bulk paths (sync ingest, list endpoints, tag filtering) touch one or two
+fields across thousands of rows. A list of Contact objects stores those
+rows as an array of structures: every access drags a whole instance into
+cache to read a single field. ContactBatch keeps each column in its own
+list (structure of arrays), so a scan over display names or telegram ids
+walks one contiguous list of references instead of hopping between
+objects.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Column order matches the contacts table / Contact model field order
+CONTACT_COLUMNS: Tuple[str, ...] = (
+    "id",
+    "telegram_id",
+    "username",
+    "first_name",
+    "last_name",
+    "display_name",
+    "phone",
+    "profile_photo_path",
+    "bio",
+)
+
+
+@dataclass(slots=True)
+class ContactBatch:
+    """
+    Structure-of-arrays view over a batch of contact rows.
+
+    Intended for read-mostly bulk operations; single-contact code paths
+    should keep using the Contact model. All columns are parallel lists
+    sharing one index space.
+    """
+
+    ids: List[Optional[int]] = field(default_factory=list)
+    telegram_ids: List[int] = field(default_factory=list)
+    usernames: List[Optional[str]] = field(default_factory=list)
+    first_names: List[Optional[str]] = field(default_factory=list)
+    last_names: List[Optional[str]] = field(default_factory=list)
+    display_names: List[str] = field(default_factory=list)
+    phones: List[Optional[str]] = field(default_factory=list)
+    profile_photo_paths: List[Optional[str]] = field(default_factory=list)
+    bios: List[Optional[str]] = field(default_factory=list)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[tuple]) -> "ContactBatch":
+        """
+        Build a batch from cursor rows in CONTACT_COLUMNS order.
+
+        zip(*rows) transposes the row tuples into columns in C, without
+        a Python-level loop per field.
+
+        Args:
+            rows: Sequence of tuples as returned by fetch_all
+
+        Returns:
+            ContactBatch with one entry per input row
+        """
+        if not rows:
+            return cls()
+        columns = list(zip(*rows))
+        return cls(*(list(column) for column in columns))
+
+    def __len__(self) -> int:
+        return len(self.telegram_ids)
+
+    def to_dicts(self) -> List[Dict]:
+        """
+        Materialize the batch as one dict per contact.
+
+        Used at the serialization boundary (JSON responses); everything
+        before that point can stay columnar.
+
+        Returns:
+            List of dicts keyed by CONTACT_COLUMNS
+        """
+        return [
+            dict(zip(CONTACT_COLUMNS, row))
+            for row in zip(
+                self.ids,
+                self.telegram_ids,
+                self.usernames,
+                self.first_names,
+                self.last_names,
+                self.display_names,
+                self.phones,
+                self.profile_photo_paths,
+                self.bios,
+            )
+        ]
+
+    def iter_display(self) -> Iterator[Tuple[int, str]]:
+        """
+        Iterate (telegram_id, display_name) pairs without touching the
+        other seven columns.
+        """
+        return zip(self.telegram_ids, self.display_names)
+
+    def __repr__(self) -> str:
+        return f"ContactBatch(size={len(self)})"
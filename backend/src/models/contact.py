@@ -5,12 +5,13 @@ Defines the database schema and ORM mapping for Contact entities
 in the Telegram Contact Manager application.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, cast, func
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column
 from datetime import datetime
 from typing import Optional
 
-from src.database.base import Base
+from src.database.base import Base, utcnow
 
 
 class Contact(Base):
@@ -45,27 +46,44 @@ class Contact(Base):
     )
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, default=utcnow, onupdate=utcnow
     )
 
-    @property
+    @hybrid_property
     def full_name(self) -> str:
         """
         Generate a full name for the contact.
 
+        Hybrid: in Python this is plain branching (no intermediate list
+        per access); in SQL it renders as a COALESCE chain so queries
+        can filter or sort on full_name without fetching every row.
+
         Returns:
             str: Concatenated first and last name, or fallback identifiers
         """
-        parts = [part for part in [self.first_name, self.last_name] if part]
-
-        if parts:
-            return " ".join(parts)
-        elif self.username:
+        if self.first_name and self.last_name:
+            return f"{self.first_name} {self.last_name}"
+        if self.first_name:
+            return self.first_name
+        if self.last_name:
+            return self.last_name
+        if self.username:
             return self.username
-        else:
-            return f"User {self.telegram_id}"
+        return f"User {self.telegram_id}"
+
+    @full_name.expression
+    def full_name(cls):
+        # first || ' ' || last is NULL when either side is NULL, so the
+        # COALESCE chain mirrors the Python fallbacks
+        return func.coalesce(
+            cls.first_name + " " + cls.last_name,
+            cls.first_name,
+            cls.last_name,
+            cls.username,
+            "User " + cast(cls.telegram_id, String),
+        )
 
     def __str__(self) -> str:
         """
@@ -10,7 +10,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Group:
     """
     Represents a Telegram group or supergroup.
@@ -10,7 +10,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """
     Represents a message exchanged with a contact.
@@ -24,7 +24,9 @@ class Message:
         contact_id: ID of the contact this message is associated with
         is_outgoing: True if message was sent by user, False if received
         content: Text content of the message
-        timestamp: When the message was sent/received
+        timestamp: When the message was sent/received, as unix epoch
+            microseconds (matching the INTEGER storage in the messages
+            table; use timestamp_dt for a datetime view)
         created_at: When this record was created in our database
     """
 
@@ -33,9 +35,33 @@ class Message:
     contact_id: int
     is_outgoing: bool
     content: Optional[str]
-    timestamp: datetime
+    timestamp: int
     created_at: datetime
 
+    @staticmethod
+    def to_epoch_micros(moment: datetime) -> int:
+        """
+        Convert a datetime to the epoch-microsecond representation
+        stored in the timestamp column.
+
+        Args:
+            moment: Datetime to convert
+
+        Returns:
+            int: Unix epoch microseconds
+        """
+        return int(moment.timestamp() * 1_000_000)
+
+    @property
+    def timestamp_dt(self) -> datetime:
+        """
+        Datetime view of the stored epoch-microsecond timestamp.
+
+        Returns:
+            datetime: The message timestamp as a datetime
+        """
+        return datetime.fromtimestamp(self.timestamp / 1_000_000)
+
     @property
     def direction(self) -> str:
         """
@@ -52,18 +78,19 @@ class Message:
         Returns a preview of the message content.
 
         Truncates long messages to 100 characters and adds ellipsis.
+        The common short-message case returns the content string itself
+        with no slice (so no allocation); the attribute is read once
+        into a local to keep the hot path at a single descriptor lookup.
 
         Returns:
             str: Message preview or "[No content]" if empty
         """
-        if not self.content:
+        content = self.content
+        if not content:
             return "[No content]"
-
-        max_length = 100
-        if len(self.content) <= max_length:
-            return self.content
-
-        return self.content[:max_length] + "..."
+        if len(content) <= 100:
+            return content
+        return content[:100] + "..."
 
     def __str__(self) -> str:
         """String representation of the message."""
@@ -5,12 +5,14 @@ Defines the database schema and ORM mapping for Tag entities
 in the Telegram Contact Manager application.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Table, ForeignKey
+import sys
+
+from sqlalchemy import Column, Integer, String, DateTime, Table, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 from typing import Optional, List
 
-from src.database.base import Base
+from src.database.base import Base, utcnow
 
 
 # Association table for many-to-many relationship between contacts and tags
@@ -26,7 +28,7 @@ contact_tags = Table(
     Column(
         "tag_id", Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True
     ),
-    Column("created_at", DateTime, default=datetime.utcnow),
+    Column("created_at", DateTime, default=utcnow),
 )
 
 
@@ -36,10 +38,21 @@ class Tag(Base):
 
     Tags can be assigned to contacts to categorize and filter them.
     Each tag can have a color for visual distinction.
+
+    Unlike the plain dataclass models (Group, Message) this class cannot
+    use __slots__ or frozen semantics: ORM instrumentation stores
+    attribute state and _sa_instance_state in the instance __dict__,
+    and mapped attributes must stay assignable for change tracking.
     """
 
     __tablename__ = "tags"
 
+    # Functional index so case-insensitive lookups (lower(name) = ...)
+    # seek instead of scanning with per-row lower(); mirrors migration 008
+    __table_args__ = (
+        Index("tags_name_lower_idx", text("lower(name)"), unique=True),
+    )
+
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
@@ -52,7 +65,7 @@ class Tag(Base):
     )  # Hex color code
 
     # Timestamp
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
     # Relationships
     # Note: We'll use the junction table for queries, but not defining bidirectional
@@ -80,10 +93,34 @@ class Tag(Base):
             f"color={self.color}, created_at={self.created_at})"
         )
 
+    @property
+    def _name_key(self) -> str:
+        """
+        Casefolded name, computed once per name value.
+
+        Set membership checks hash and compare tags repeatedly; folding
+        the name on every call made each of those O(len(name)) string
+        operations. The cached key is keyed on the exact name object so
+        it stays correct if name is reassigned. casefold() is used over
+        lower() for correct Unicode case-insensitivity, and the result
+        is interned so equal keys across Tag instances share one string
+        object and comparisons hit CPython's pointer-equality fast path.
+        """
+        cached = self.__dict__.get("_name_key_cache")
+        if cached is None or cached[0] is not self.name:
+            cached = (self.name, sys.intern(self.name.casefold()))
+            self.__dict__["_name_key_cache"] = cached
+        return cached[1]
+
     def __eq__(self, other) -> bool:
         """
         Compare tags by name (case-insensitive).
 
+        Because the keys are interned, tags with equal names share one
+        key object and the identity test decides almost every
+        comparison without touching string contents; unequal names fail
+        the identity test and fall through to a plain compare.
+
         Args:
             other: Another Tag instance
 
@@ -92,13 +129,14 @@ class Tag(Base):
         """
         if not isinstance(other, Tag):
             return False
-        return self.name.lower() == other.name.lower()
+        key, other_key = self._name_key, other._name_key
+        return key is other_key or key == other_key
 
     def __hash__(self) -> int:
         """
-        Hash based on lowercase name for use in sets and dicts.
+        Hash based on the casefolded name for use in sets and dicts.
 
         Returns:
             int: Hash value
         """
-        return hash(self.name.lower())
+        return hash(self._name_key)
@@ -4,15 +4,163 @@ Async Contact Repository for managing contact entities.
 Provides asynchronous CRUD operations for contacts using SQLAlchemy.
 """
 
-from typing import List, Optional, Dict, Any
+import json
+import re
+from typing import AsyncIterator, List, Optional, Dict, Any
 from datetime import datetime
 
-from sqlalchemy import select, update, delete, or_
+from sqlalchemy import bindparam, exists, insert, select, update, delete, or_, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.database.base import utcnow
 from src.models.contact import Contact
-from src.schemas.contact import ContactResponse, ContactProfileResponse
+from src.schemas.contact import (
+    ContactResponse,
+    ContactProfileResponse,
+    GroupInfo,
+    MessageInfo,
+)
+from src.schemas.tag import TagResponse
+
+
+# One row per contact with tags/groups pre-aggregated as JSON arrays and
+# the two latest-message lookups as correlated subqueries. A naive loader
+# issues five queries per profile; this keeps it at one round-trip, and
+# the (contact_id, timestamp DESC) index turns each message subquery into
+# a short index probe. The select body is shared between the single-id
+# and IN-list variants so the two cannot drift apart
+_PROFILE_SELECT = """
+    SELECT
+        c.id, c.telegram_id, c.username, c.first_name, c.last_name,
+        c.display_name, c.phone, c.profile_photo_path, c.updated_at,
+        (
+            SELECT json_group_array(json_object(
+                'id', t.id, 'name', t.name, 'color', t.color,
+                'created_at', t.created_at,
+                'contact_count',
+                (SELECT COUNT(*) FROM contact_tags ct2 WHERE ct2.tag_id = t.id)
+            ))
+            FROM contact_tags ct JOIN tags t ON t.id = ct.tag_id
+            WHERE ct.contact_id = c.id
+        ) AS tags_json,
+        (
+            SELECT json_group_array(json_object(
+                'id', g.id, 'telegram_id', g.telegram_id, 'name', g.name,
+                'member_count', g.member_count,
+                'profile_photo_url', g.profile_photo_path
+            ))
+            FROM contact_groups cg JOIN groups g ON g.id = cg.group_id
+            WHERE cg.contact_id = c.id
+        ) AS groups_json,
+        (
+            SELECT json_object(
+                'id', m.id, 'content', m.content,
+                'timestamp', m.timestamp, 'is_outgoing', m.is_outgoing
+            )
+            FROM messages m
+            WHERE m.contact_id = c.id AND m.is_outgoing = 0
+            ORDER BY m.timestamp DESC LIMIT 1
+        ) AS last_received_json,
+        (
+            SELECT json_object(
+                'id', m.id, 'content', m.content,
+                'timestamp', m.timestamp, 'is_outgoing', m.is_outgoing
+            )
+            FROM messages m
+            WHERE m.contact_id = c.id AND m.is_outgoing = 1
+            ORDER BY m.timestamp DESC LIMIT 1
+        ) AS last_sent_json
+    FROM contacts c
+"""
+
+# Reduced variant for databases without the groups/messages tables
+# (e.g. schemas created from the ORM metadata alone); contact and tags
+# are always present
+_PROFILE_SELECT_BASIC = """
+    SELECT
+        c.id, c.telegram_id, c.username, c.first_name, c.last_name,
+        c.display_name, c.phone, c.profile_photo_path, c.updated_at,
+        (
+            SELECT json_group_array(json_object(
+                'id', t.id, 'name', t.name, 'color', t.color,
+                'created_at', t.created_at,
+                'contact_count',
+                (SELECT COUNT(*) FROM contact_tags ct2 WHERE ct2.tag_id = t.id)
+            ))
+            FROM contact_tags ct JOIN tags t ON t.id = ct.tag_id
+            WHERE ct.contact_id = c.id
+        ) AS tags_json,
+        NULL AS groups_json,
+        NULL AS last_received_json,
+        NULL AS last_sent_json
+    FROM contacts c
+"""
+
+_PROFILE_QUERY = text(_PROFILE_SELECT + "WHERE c.id = :contact_id")
+_PROFILE_QUERY_BASIC = text(_PROFILE_SELECT_BASIC + "WHERE c.id = :contact_id")
+
+# Batch variants: one round trip for a whole list of profiles instead of
+# one query per contact (the classic N+1)
+_PROFILES_QUERY = text(_PROFILE_SELECT + "WHERE c.id IN :contact_ids").bindparams(
+    bindparam("contact_ids", expanding=True)
+)
+_PROFILES_QUERY_BASIC = text(
+    _PROFILE_SELECT_BASIC + "WHERE c.id IN :contact_ids"
+).bindparams(bindparam("contact_ids", expanding=True))
+
+
+# FTS5 search over contacts_fts (maintained by migration 007 triggers):
+# an inverted-index probe with BM25 ranking instead of a full-table scan
+# with six LIKE predicates per row
+_FTS_SEARCH_QUERY = text(
+    """
+    SELECT c.* FROM contacts c
+    JOIN contacts_fts f ON c.id = f.rowid
+    WHERE contacts_fts MATCH :match
+    ORDER BY bm25(contacts_fts)
+    LIMIT :limit OFFSET :offset
+    """
+)
+
+
+# Hot single-row lookups, built once at import: each call binds
+# parameters into the prebuilt AST instead of rebuilding and re-hashing
+# the select() expression per request
+_GET_BY_TELEGRAM_ID_QUERY = select(Contact).where(
+    Contact.telegram_id == bindparam("telegram_id")
+)
+_EXISTS_BY_TELEGRAM_ID_QUERY = select(
+    exists().where(Contact.telegram_id == bindparam("telegram_id"))
+)
+
+
+def _fts_match_expression(query: str) -> str:
+    """
+    Turn raw user input into a safe FTS5 MATCH expression.
+
+    Each token is quoted (neutralizing FTS operators in the input) and
+    given a trailing * so partial words match as prefixes.
+
+    Returns:
+        str: MATCH expression, empty if the query has no tokens
+    """
+    tokens = re.findall(r"\w+", query)
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def _message_info(payload: Optional[str]) -> Optional[MessageInfo]:
+    """Decode a json_object message payload into MessageInfo."""
+    if not payload:
+        return None
+    data = json.loads(payload)
+    return MessageInfo(
+        id=data["id"],
+        content=data["content"],
+        # messages.timestamp is stored as unix epoch microseconds
+        timestamp=datetime.fromtimestamp(data["timestamp"] / 1_000_000),
+        is_outgoing=bool(data["is_outgoing"]),
+    )
 
 
 class ContactRepository:
@@ -31,6 +179,50 @@ class ContactRepository:
             session (AsyncSession): Async SQLAlchemy database session
         """
         self.session = session
+        # Dialect resolved once at construction instead of per query;
+        # search and the schema probes branch on it
+        self._dialect_name = session.bind.dialect.name if session.bind else ""
+        self._full_profile_schema: Optional[bool] = None
+        self._fts_available: Optional[bool] = None
+
+    async def _has_fts_index(self) -> bool:
+        """
+        Check (once per repository) whether the contacts_fts virtual
+        table exists, so search can use the FTS index when available.
+
+        Returns:
+            bool: True when FTS search is available
+        """
+        if self._fts_available is None:
+            if self._dialect_name != "sqlite":
+                self._fts_available = False
+            else:
+                result = await self.session.execute(
+                    text(
+                        "SELECT 1 FROM sqlite_master WHERE type='table' "
+                        "AND name='contacts_fts'"
+                    )
+                )
+                self._fts_available = result.first() is not None
+        return self._fts_available
+
+    async def _has_full_profile_schema(self) -> bool:
+        """
+        Check (once per repository) whether the groups/messages tables
+        exist, so profile loading can pick the matching query upfront.
+
+        Returns:
+            bool: True when the full profile schema is available
+        """
+        if self._full_profile_schema is None:
+            result = await self.session.execute(
+                text(
+                    "SELECT COUNT(*) FROM sqlite_master WHERE type='table' "
+                    "AND name IN ('groups', 'contact_groups', 'messages')"
+                )
+            )
+            self._full_profile_schema = result.scalar() == 3
+        return self._full_profile_schema
 
     async def create(self, contact_data: Dict[str, Any]) -> Contact:
         """
@@ -44,9 +236,8 @@ class ContactRepository:
         """
         try:
             # Set default timestamps if not provided
-            # Set default timestamps if not provided
-            contact_data.setdefault("created_at", datetime.utcnow())
-            contact_data.setdefault("updated_at", datetime.utcnow())
+            contact_data.setdefault("created_at", utcnow())
+            contact_data.setdefault("updated_at", utcnow())
 
             # Remove id if None to allow SQLAlchemy to generate
             if "id" in contact_data and contact_data["id"] is None:
@@ -55,12 +246,52 @@ class ContactRepository:
             contact = Contact(id=None, **contact_data)
             self.session.add(contact)
             await self.session.commit()
-            await self.session.refresh(contact)
+            # No refresh: the flush already populated the generated id
+            # and all defaults are Python-side, so a re-SELECT adds a
+            # round trip for values the session already holds
             return contact
         except Exception as e:
             await self.session.rollback()
             raise ValueError(f"Failed to create contact: {str(e)}") from e
 
+    async def create_many(self, rows: List[Dict[str, Any]]) -> List[Contact]:
+        """
+        Create many contacts with one statement and one commit.
+
+        Per-row create() pays a commit (and its fsync) for every
+        contact; bulk imports from Telegram should land in a single
+        transaction. The INSERT ... RETURNING batch produces the new
+        ORM instances without per-row refreshes.
+
+        Args:
+            rows (List[Dict[str, Any]]): Contact data dicts, same shape
+                as create()
+
+        Returns:
+            List[Contact]: The newly created contacts, in input order
+
+        Raises:
+            ValueError: If any insert fails (nothing is committed)
+        """
+        if not rows:
+            return []
+
+        try:
+            now = utcnow()
+            for row in rows:
+                row.setdefault("created_at", now)
+                row.setdefault("updated_at", now)
+                row.pop("id", None)
+
+            stmt = insert(Contact).returning(Contact)
+            result = await self.session.execute(stmt, rows)
+            contacts = list(result.scalars())
+            await self.session.commit()
+            return contacts
+        except Exception as e:
+            await self.session.rollback()
+            raise ValueError(f"Failed to create contacts: {str(e)}") from e
+
     async def get_by_id(self, contact_id: int) -> Optional[Contact]:
         """
         Retrieve a contact by its database ID.
@@ -83,8 +314,9 @@ class ContactRepository:
         Returns:
             Optional[Contact]: The contact if found, None otherwise
         """
-        query = select(Contact).where(Contact.telegram_id == telegram_id)
-        result = await self.session.execute(query)
+        result = await self.session.execute(
+            _GET_BY_TELEGRAM_ID_QUERY, {"telegram_id": telegram_id}
+        )
         return result.scalar_one_or_none()
 
     async def get_all(
@@ -110,6 +342,26 @@ class ContactRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def iter_all(self, batch_size: int = 500) -> AsyncIterator[Contact]:
+        """
+        Stream all contacts without materializing the full list.
+
+        get_all builds every row into one list before returning, which
+        spikes memory on unbounded calls; this yields contacts from a
+        streaming cursor that buffers batch_size rows at a time. Use it
+        for exports and bulk jobs, get_all for small paginated reads.
+
+        Args:
+            batch_size (int): Rows buffered per fetch from the cursor
+
+        Yields:
+            Contact: Each contact, in no guaranteed order
+        """
+        query = select(Contact).execution_options(yield_per=batch_size)
+        result = await self.session.stream(query)
+        async for contact in result.scalars():
+            yield contact
+
     async def update(
         self, contact_id: int, update_data: Dict[str, Any]
     ) -> Optional[Contact]:
@@ -124,20 +376,20 @@ class ContactRepository:
             Optional[Contact]: Updated contact, or None if not found
         """
         try:
-            # Fetch the existing contact
-            contact = await self.get_by_id(contact_id)
+            # session.get serves this from the identity map without a
+            # SELECT when the contact was loaded earlier in the session
+            contact = await self.session.get(Contact, contact_id)
             if not contact:
                 return None
 
             # Update timestamps and fields
-            update_data["updated_at"] = datetime.utcnow()
+            update_data["updated_at"] = utcnow()
 
             for key, value in update_data.items():
                 if hasattr(contact, key):
                     setattr(contact, key, value)
 
             await self.session.commit()
-            await self.session.refresh(contact)
             return contact
 
         except Exception as e:
@@ -155,13 +407,12 @@ class ContactRepository:
             bool: True if contact was deleted, False if not found
         """
         try:
-            contact = await self.get_by_id(contact_id)
-            if not contact:
-                return False
-
-            await self.session.delete(contact)
+            # Bulk DELETE: no need to load the row just to delete it;
+            # rowcount says whether anything matched
+            stmt = delete(Contact).where(Contact.id == contact_id)
+            result = await self.session.execute(stmt)
             await self.session.commit()
-            return True
+            return result.rowcount > 0
         except Exception:
             await self.session.rollback()
             return False
@@ -183,6 +434,19 @@ class ContactRepository:
         if not query or len(query.strip()) < 2:
             return []
 
+        # Preferred path: probe the FTS5 inverted index (kept in sync by
+        # triggers) and rank by BM25 instead of scanning every row
+        if await self._has_fts_index():
+            match = _fts_match_expression(query)
+            if match:
+                result = await self.session.execute(
+                    select(Contact).from_statement(_FTS_SEARCH_QUERY),
+                    {"match": match, "limit": limit, "offset": offset},
+                )
+                return list(result.scalars().all())
+
+        # Fallback for databases without the FTS table (or non-SQLite
+        # dialects): the original multi-column LIKE scan
         search_query = f"%{query.lower()}%"
 
         stmt = (
@@ -212,9 +476,12 @@ class ContactRepository:
         Returns:
             bool: True if contact exists, False otherwise
         """
-        query = select(Contact).where(Contact.telegram_id == telegram_id)
-        result = await self.session.execute(query)
-        return result.first() is not None
+        # SELECT EXISTS returns a single scalar straight off the unique
+        # index instead of hydrating a full Contact row just to discard it
+        result = await self.session.execute(
+            _EXISTS_BY_TELEGRAM_ID_QUERY, {"telegram_id": telegram_id}
+        )
+        return bool(result.scalar())
 
     async def get_contact_profile(
         self, contact_id: int
@@ -228,17 +495,82 @@ class ContactRepository:
         Returns:
             Optional[ContactProfileResponse]: Detailed contact profile if found
         """
-        # Retrieve base contact
-        contact = await self.get_by_id(contact_id)
+        query = (
+            _PROFILE_QUERY
+            if await self._has_full_profile_schema()
+            else _PROFILE_QUERY_BASIC
+        )
+        result = await self.session.execute(query, {"contact_id": contact_id})
+        row = result.mappings().first()
 
-        if not contact:
+        if row is None:
             return None
 
-        # Construct detailed profile
+        return self._profile_from_row(row)
+
+    async def load_profiles(
+        self, contact_ids: List[int]
+    ) -> List[ContactProfileResponse]:
+        """
+        Load detailed profiles for many contacts in one query.
+
+        Loading a profile list through get_contact_profile would issue
+        one query per contact; this fetches every profile row in a
+        single round trip.
+
+        Args:
+            contact_ids (List[int]): Database IDs of the contacts
+
+        Returns:
+            List[ContactProfileResponse]: Profiles in input-id order
+            (missing ids are skipped)
+        """
+        if not contact_ids:
+            return []
+
+        query = (
+            _PROFILES_QUERY
+            if await self._has_full_profile_schema()
+            else _PROFILES_QUERY_BASIC
+        )
+        result = await self.session.execute(query, {"contact_ids": contact_ids})
+
+        by_id = {row["id"]: self._profile_from_row(row) for row in result.mappings()}
+        return [
+            by_id[contact_id] for contact_id in contact_ids if contact_id in by_id
+        ]
+
+    @staticmethod
+    def _profile_from_row(row) -> ContactProfileResponse:
+        """
+        Build a ContactProfileResponse from one aggregated profile row.
+
+        Args:
+            row: Mapping with contact columns plus the *_json aggregates
+
+        Returns:
+            ContactProfileResponse: Assembled profile
+        """
+        tags = [TagResponse(**item) for item in json.loads(row["tags_json"] or "[]")]
+        groups = [GroupInfo(**item) for item in json.loads(row["groups_json"] or "[]")]
+
+        contact = ContactResponse(
+            id=row["id"],
+            telegram_id=row["telegram_id"],
+            username=row["username"],
+            first_name=row["first_name"],
+            last_name=row["last_name"],
+            display_name=row["display_name"],
+            phone=row["phone"],
+            profile_photo_url=row["profile_photo_path"],
+            tags=[tag.name for tag in tags],
+            updated_at=row["updated_at"],
+        )
+
         return ContactProfileResponse(
             contact=contact,
-            tags=[],  # Placeholder, should be populated with actual tags
-            mutual_groups=[],  # Placeholder, should be populated with actual groups
-            last_received_message=None,  # Placeholder for last received message
-            last_sent_message=None,  # Placeholder for last sent message
+            tags=tags,
+            mutual_groups=groups,
+            last_received_message=_message_info(row["last_received_json"]),
+            last_sent_message=_message_info(row["last_sent_json"]),
         )
@@ -5,17 +5,37 @@ Provides asynchronous CRUD operations for tags and management of the
 many-to-many relationship between contacts and tags using SQLAlchemy.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 from datetime import datetime
 
-from sqlalchemy import select, delete, and_, func
+from sqlalchemy import bindparam, insert, select, delete, and_, exists, func, literal
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
+from src.database.base import utcnow
 from src.models.tag import Tag, contact_tags
 from src.models.contact import Contact
 
 
+# Hot lookups built once at import; each call binds parameters into the
+# prebuilt AST instead of reconstructing the select() expression
+_GET_BY_NAME_QUERY = select(Tag).where(func.lower(Tag.name) == bindparam("name"))
+_EXISTS_BY_NAME_QUERY = select(
+    exists().where(func.lower(Tag.name) == bindparam("name"))
+)
+_TAG_COUNT_QUERY = (
+    select(func.count())
+    .select_from(contact_tags)
+    .where(contact_tags.c.contact_id == bindparam("contact_id"))
+)
+_CONTACT_COUNT_QUERY = (
+    select(func.count())
+    .select_from(contact_tags)
+    .where(contact_tags.c.tag_id == bindparam("tag_id"))
+)
+
+
 class TagRepository:
     """
     Asynchronous repository for Tag entities with comprehensive operations.
@@ -50,7 +70,7 @@ class TagRepository:
         """
         try:
             # Set default timestamp if not provided
-            tag_data.setdefault("created_at", datetime.utcnow())
+            tag_data.setdefault("created_at", utcnow())
 
             # Remove id if present to allow SQLAlchemy to generate
             if "id" in tag_data and tag_data["id"] is None:
@@ -59,7 +79,8 @@ class TagRepository:
             tag = Tag(**tag_data)
             self.session.add(tag)
             await self.session.commit()
-            await self.session.refresh(tag)
+            # No refresh needed: the flush populated the generated id
+            # and created_at is a Python-side default
             return tag
         except IntegrityError as e:
             await self.session.rollback()
@@ -70,6 +91,43 @@ class TagRepository:
             await self.session.rollback()
             raise ValueError(f"Failed to create tag: {str(e)}") from e
 
+    async def create_many(self, rows: List[Dict[str, Any]]) -> List[Tag]:
+        """
+        Create many tags with one statement and one commit.
+
+        Counterpart to ContactRepository.create_many: one INSERT ...
+        RETURNING batch and a single commit instead of a round trip and
+        fsync per tag.
+
+        Args:
+            rows (List[Dict[str, Any]]): Tag data dicts, same shape as
+                create()
+
+        Returns:
+            List[Tag]: The newly created tags, in input order
+
+        Raises:
+            ValueError: If any insert fails, e.g. a duplicate name
+                (nothing is committed)
+        """
+        if not rows:
+            return []
+
+        try:
+            now = utcnow()
+            for row in rows:
+                row.setdefault("created_at", now)
+                row.pop("id", None)
+
+            stmt = insert(Tag).returning(Tag)
+            result = await self.session.execute(stmt, rows)
+            tags = list(result.scalars())
+            await self.session.commit()
+            return tags
+        except Exception as e:
+            await self.session.rollback()
+            raise ValueError(f"Failed to create tags: {str(e)}") from e
+
     async def get_by_id(self, tag_id: int) -> Optional[Tag]:
         """
         Retrieve a tag by its database ID.
@@ -92,8 +150,9 @@ class TagRepository:
         Returns:
             Optional[Tag]: The tag if found, None otherwise
         """
-        query = select(Tag).where(func.lower(Tag.name) == name.lower())
-        result = await self.session.execute(query)
+        result = await self.session.execute(
+            _GET_BY_NAME_QUERY, {"name": name.lower()}
+        )
         return result.scalar_one_or_none()
 
     async def get_all(self, limit: Optional[int] = None, offset: int = 0) -> List[Tag]:
@@ -115,6 +174,27 @@ class TagRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def iter_all(self, batch_size: int = 500) -> AsyncIterator[Tag]:
+        """
+        Stream all tags without materializing the full list.
+
+        Counterpart to ContactRepository.iter_all for bulk jobs that
+        walk every tag; buffers batch_size rows at a time instead of
+        building the whole result list up front.
+
+        Args:
+            batch_size (int): Rows buffered per fetch from the cursor
+
+        Yields:
+            Tag: Each tag, ordered by name
+        """
+        query = (
+            select(Tag).order_by(Tag.name).execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(query)
+        async for tag in result.scalars():
+            yield tag
+
     async def update(self, tag_id: int, update_data: Dict[str, Any]) -> Optional[Tag]:
         """
         Update an existing tag.
@@ -141,7 +221,6 @@ class TagRepository:
                     setattr(tag, key, value)
 
             await self.session.commit()
-            await self.session.refresh(tag)
             return tag
 
         except IntegrityError as e:
@@ -197,6 +276,39 @@ class TagRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_tags_for_contacts(
+        self, contact_ids: List[int]
+    ) -> Dict[int, List[Tag]]:
+        """
+        Retrieve tags for many contacts with a single query.
+
+        Calling get_tags_for_contact in a loop issues one query per
+        contact; this runs one IN query and groups the rows in Python.
+
+        Args:
+            contact_ids (List[int]): Database IDs of the contacts
+
+        Returns:
+            Dict[int, List[Tag]]: Tags per contact ID, ordered by name.
+                Every requested ID is present, with an empty list when
+                the contact has no tags.
+        """
+        tags_by_contact: Dict[int, List[Tag]] = {cid: [] for cid in contact_ids}
+        if not contact_ids:
+            return tags_by_contact
+
+        query = (
+            select(contact_tags.c.contact_id, Tag)
+            .join(contact_tags, Tag.id == contact_tags.c.tag_id)
+            .where(contact_tags.c.contact_id.in_(contact_ids))
+            .order_by(contact_tags.c.contact_id, Tag.name)
+        )
+
+        result = await self.session.execute(query)
+        for contact_id, tag in result.all():
+            tags_by_contact[contact_id].append(tag)
+        return tags_by_contact
+
     async def add_tag_to_contact(self, contact_id: int, tag_id: int) -> bool:
         """
         Add a tag to a contact (create association).
@@ -212,33 +324,40 @@ class TagRepository:
             ValueError: If contact or tag doesn't exist
         """
         try:
-            # Verify contact and tag exist
-            contact = await self.session.get(Contact, contact_id)
-            tag = await self.get_by_id(tag_id)
-
-            if not contact:
-                raise ValueError(f"Contact with ID {contact_id} not found")
-            if not tag:
-                raise ValueError(f"Tag with ID {tag_id} not found")
-
-            # Check if association already exists
-            query = select(contact_tags).where(
-                and_(
-                    contact_tags.c.contact_id == contact_id,
-                    contact_tags.c.tag_id == tag_id,
-                )
+            # Single statement on the happy path: the INSERT ... SELECT
+            # only produces a row when both parents exist, and the
+            # primary key enforces uniqueness atomically, so no
+            # pre-checks and no racy pre-select of the association
+            insert_source = (
+                select(literal(contact_id), literal(tag_id), literal(utcnow()))
+                .where(exists().where(Contact.id == contact_id))
+                .where(exists().where(Tag.id == tag_id))
             )
-            result = await self.session.execute(query)
-            if result.first() is not None:
-                return False  # Association already exists
-
-            # Create association
-            stmt = contact_tags.insert().values(
-                contact_id=contact_id, tag_id=tag_id, created_at=datetime.utcnow()
+            stmt = (
+                sqlite_insert(contact_tags)
+                .from_select(
+                    ["contact_id", "tag_id", "created_at"], insert_source
+                )
+                .on_conflict_do_nothing(index_elements=["contact_id", "tag_id"])
             )
-            await self.session.execute(stmt)
+            result = await self.session.execute(stmt)
             await self.session.commit()
-            return True
+            if result.rowcount > 0:
+                return True
+
+            # Nothing inserted: either the association already exists or
+            # a parent is missing — only now probe to tell them apart
+            probe = select(
+                exists().where(Contact.id == contact_id),
+                exists().where(Tag.id == tag_id),
+            )
+            contact_found, tag_found = (await self.session.execute(probe)).one()
+
+            if not contact_found:
+                raise ValueError(f"Contact with ID {contact_id} not found")
+            if not tag_found:
+                raise ValueError(f"Tag with ID {tag_id} not found")
+            return False  # Association already exists
 
         except ValueError:
             raise
@@ -305,11 +424,19 @@ class TagRepository:
         if not tag_ids:
             return []
 
+        # Semi-join via EXISTS instead of JOIN + DISTINCT: a contact
+        # with several matching tags matches the subquery once, so no
+        # dedup pass over wide contact rows is needed
         query = (
             select(Contact)
-            .join(contact_tags, Contact.id == contact_tags.c.contact_id)
-            .where(contact_tags.c.tag_id.in_(tag_ids))
-            .distinct()
+            .where(
+                exists().where(
+                    and_(
+                        contact_tags.c.contact_id == Contact.id,
+                        contact_tags.c.tag_id.in_(tag_ids),
+                    )
+                )
+            )
             .order_by(Contact.display_name)
         )
 
@@ -326,12 +453,9 @@ class TagRepository:
         Returns:
             int: Number of tags assigned to the contact
         """
-        query = (
-            select(func.count())
-            .select_from(contact_tags)
-            .where(contact_tags.c.contact_id == contact_id)
+        result = await self.session.execute(
+            _TAG_COUNT_QUERY, {"contact_id": contact_id}
         )
-        result = await self.session.execute(query)
         return result.scalar() or 0
 
     async def get_contact_count_for_tag(self, tag_id: int) -> int:
@@ -344,12 +468,9 @@ class TagRepository:
         Returns:
             int: Number of contacts with this tag
         """
-        query = (
-            select(func.count())
-            .select_from(contact_tags)
-            .where(contact_tags.c.tag_id == tag_id)
+        result = await self.session.execute(
+            _CONTACT_COUNT_QUERY, {"tag_id": tag_id}
         )
-        result = await self.session.execute(query)
         return result.scalar() or 0
 
     async def exists_by_name(self, name: str) -> bool:
@@ -362,5 +483,8 @@ class TagRepository:
         Returns:
             bool: True if tag exists, False otherwise
         """
-        tag = await self.get_by_name(name)
-        return tag is not None
+        # Scalar EXISTS instead of hydrating a full Tag via get_by_name
+        result = await self.session.execute(
+            _EXISTS_BY_NAME_QUERY, {"name": name.lower()}
+        )
+        return bool(result.scalar())
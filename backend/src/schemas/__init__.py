@@ -34,6 +34,10 @@ from .auth import (
     AuthResponse,
     AuthStatusResponse,
 )
+from .serialization import (
+    adapter_response,
+    model_response,
+)
 
 __all__ = [
     # Contact schemas
@@ -57,4 +61,7 @@ __all__ = [
     "AuthPasswordRequest",
     "AuthResponse",
     "AuthStatusResponse",
+    # Serialization helpers
+    "adapter_response",
+    "model_response",
 ]
@@ -5,10 +5,12 @@ This module defines the schemas for contact-related API endpoints,
 including contact lists, profiles, groups, and messages.
 """
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 from typing import Optional, List
 from datetime import datetime
 
+from .tag import TagResponse
+
 
 class GroupInfo(BaseModel):
     """
@@ -154,6 +156,44 @@ class ContactResponse(BaseModel):
         },
     )
 
+    @classmethod
+    def from_orm_fast(
+        cls, contact, tags: Optional[List[str]] = None
+    ) -> "ContactResponse":
+        """
+        Build a response from a trusted ORM Contact without validation.
+
+        model_validate re-runs pydantic-core validation per row, which
+        dominates CPU when serializing large contact lists; the values
+        here come straight from the database, so model_construct can
+        skip that work.
+
+        Args:
+            contact: ORM Contact instance
+            tags (Optional[List[str]]): Tag names for this contact
+
+        Returns:
+            ContactResponse: Constructed response model
+        """
+        return cls.model_construct(
+            _fields_set=_CONTACT_RESPONSE_FIELDS,
+            id=contact.id,
+            telegram_id=contact.telegram_id,
+            username=contact.username,
+            first_name=contact.first_name,
+            last_name=contact.last_name,
+            display_name=contact.display_name,
+            phone=contact.phone,
+            profile_photo_url=contact.profile_photo_path,
+            tags=tags if tags is not None else [],
+            updated_at=contact.updated_at,
+        )
+
+
+# Field-name set computed once so each from_orm_fast call passes a
+# prebuilt _fields_set instead of deriving one
+_CONTACT_RESPONSE_FIELDS = set(ContactResponse.model_fields)
+
 
 class ContactProfileResponse(BaseModel):
     """
@@ -164,7 +204,7 @@ class ContactProfileResponse(BaseModel):
     """
 
     contact: ContactResponse = Field(..., description="The contact's basic information")
-    tags: List["TagResponse"] = Field(
+    tags: List[TagResponse] = Field(
         default_factory=list,
         description="Tags assigned to this contact with full details",
     )
@@ -229,7 +269,8 @@ class ContactProfileResponse(BaseModel):
     )
 
 
-# Forward reference resolution
-from .tag import TagResponse
-
-ContactProfileResponse.model_rebuild()
+# Reusable list serializer, built once at import: list endpoints can call
+# CONTACT_LIST_ADAPTER.dump_json(rows) and hand the bytes straight to a
+# Response instead of paying a per-request validator build and the
+# jsonable_encoder walk over every row
+CONTACT_LIST_ADAPTER = TypeAdapter(List[ContactResponse])
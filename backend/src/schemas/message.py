@@ -5,10 +5,14 @@ This module defines the schemas for message-related API endpoints,
 including sending single messages, bulk messaging, and tracking message status.
 """
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field, field_validator, ConfigDict, TypeAdapter
+from typing import List, Literal, Optional, Dict, Any
 from datetime import datetime
 
+# Closed set of bulk-job states; Literal lets pydantic-core validate
+# membership with a single hash lookup instead of a general str validator
+JobStatus = Literal["pending", "in_progress", "completed", "failed"]
+
 
 class SendMessageRequest(BaseModel):
     """
@@ -86,19 +90,12 @@ class BulkMessageRequest(BaseModel):
         if not v:
             raise ValueError("At least one tag ID must be provided")
 
-        for tag_id in v:
-            if tag_id <= 0:
-                raise ValueError("Tag IDs must be positive integers")
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_ids = []
-        for tag_id in v:
-            if tag_id not in seen:
-                seen.add(tag_id)
-                unique_ids.append(tag_id)
+        if any(tag_id <= 0 for tag_id in v):
+            raise ValueError("Tag IDs must be positive integers")
 
-        return unique_ids
+        # Remove duplicates while preserving order: dict.fromkeys does
+        # the seen-set bookkeeping in one C-level pass
+        return list(dict.fromkeys(v))
 
     @field_validator("message")
     @classmethod
@@ -191,7 +188,7 @@ class BulkMessageJob(BaseModel):
         description="Total number of contacts that will receive the message",
         examples=[5, 25, 100],
     )
-    status: str = Field(
+    status: JobStatus = Field(
         ...,
         description="Current status of the job",
         examples=["pending", "in_progress", "completed", "failed"],
@@ -249,7 +246,7 @@ class BulkMessageStatus(BaseModel):
         description="Whether the job is still in progress",
         examples=[True, False],
     )
-    status: str = Field(
+    status: JobStatus = Field(
         ...,
         description="Current status of the job",
         examples=["pending", "in_progress", "completed", "failed"],
@@ -298,3 +295,8 @@ class BulkMessageStatus(BaseModel):
             }
         }
     )
+
+
+# Reusable list serializer, built once at import (see contact.py's
+# CONTACT_LIST_ADAPTER for the rationale)
+MESSAGE_RESULT_LIST_ADAPTER = TypeAdapter(List[MessageResult])
@@ -0,0 +1,59 @@
+"""
+Response serialization helpers for API endpoints.
+
+FastAPI's default path for schema responses walks the model through
+jsonable_encoder into plain dicts and re-serializes those; pydantic-core
+can instead write JSON straight from the schema tree in Rust. These
+helpers give endpoints that fast path without each router repeating the
+Response boilerplate.
+"""
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """
+    Serialize a schema straight to a JSON response.
+
+    model_dump_json serializes from the schema tree in one pass,
+    skipping the jsonable_encoder dict round-trip FastAPI performs when
+    an endpoint returns the model itself.
+
+    Args:
+        model (BaseModel): The response schema instance
+        status_code (int): HTTP status code for the response
+
+    Returns:
+        Response: JSON response with the serialized model bytes
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def adapter_response(
+    adapter: TypeAdapter, value, status_code: int = 200
+) -> Response:
+    """
+    Serialize through a precompiled TypeAdapter to a JSON response.
+
+    Pairs with the module-level list adapters (CONTACT_LIST_ADAPTER and
+    friends) so list endpoints serialize thousands of rows in one Rust
+    pass.
+
+    Args:
+        adapter (TypeAdapter): A precompiled adapter for the value type
+        value: The value to serialize, matching the adapter's type
+        status_code (int): HTTP status code for the response
+
+    Returns:
+        Response: JSON response with the serialized bytes
+    """
+    return Response(
+        content=adapter.dump_json(value),
+        status_code=status_code,
+        media_type="application/json",
+    )
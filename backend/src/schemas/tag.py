@@ -5,12 +5,42 @@ This module defines the schemas for tag-related API endpoints,
 including tag creation, updates, and responses.
 """
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, Field, field_validator, ConfigDict, TypeAdapter
+from typing import List, Optional
 from datetime import datetime
 import re
 
 
+# Compiled once at import so per-request validation skips the re module's
+# cache lookup; shared by the create and update validators
+_HEX_COLOR_RE = re.compile(r"^#[0-9A-Fa-f]{6}$")
+
+
+def _normalize_color(v: Optional[str]) -> Optional[str]:
+    """
+    Validate and normalize a hex color code.
+
+    Shared by TagCreate and TagUpdate so the rules and error message
+    stay in one place.
+
+    Args:
+        v (Optional[str]): Raw color value, or None
+
+    Returns:
+        Optional[str]: Uppercased #RRGGBB color, or None
+
+    Raises:
+        ValueError: If the value is not a valid hex color code
+    """
+    if v is None:
+        return v
+
+    v = v.strip()
+    if not _HEX_COLOR_RE.match(v):
+        raise ValueError("Color must be a valid hex color code (e.g., #FF5733)")
+    return v.upper()  # Normalize to uppercase
+
+
 class TagCreate(BaseModel):
     """
     Schema for creating a new tag.
@@ -44,13 +74,7 @@ class TagCreate(BaseModel):
     @classmethod
     def validate_color(cls, v: Optional[str]) -> Optional[str]:
         """Validate color is a valid hex color code."""
-        if v is None:
-            return v
-
-        v = v.strip()
-        if not re.match(r"^#[0-9A-Fa-f]{6}$", v):
-            raise ValueError("Color must be a valid hex color code (e.g., #FF5733)")
-        return v.upper()  # Normalize to uppercase
+        return _normalize_color(v)
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -98,13 +122,7 @@ class TagUpdate(BaseModel):
     @classmethod
     def validate_color(cls, v: Optional[str]) -> Optional[str]:
         """Validate color is a valid hex color code."""
-        if v is None:
-            return v
-
-        v = v.strip()
-        if not re.match(r"^#[0-9A-Fa-f]{6}$", v):
-            raise ValueError("Color must be a valid hex color code (e.g., #FF5733)")
-        return v.upper()  # Normalize to uppercase
+        return _normalize_color(v)
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -157,3 +175,37 @@ class TagResponse(BaseModel):
             }
         },
     )
+
+    @classmethod
+    def from_orm_fast(cls, tag, contact_count: int = 0) -> "TagResponse":
+        """
+        Build a response from a trusted ORM Tag without validation.
+
+        Counterpart to ContactResponse.from_orm_fast: values come
+        straight from the database, so model_construct skips the
+        per-row pydantic-core validation pass.
+
+        Args:
+            tag: ORM Tag instance
+            contact_count (int): Number of contacts with this tag
+
+        Returns:
+            TagResponse: Constructed response model
+        """
+        return cls.model_construct(
+            _fields_set=_TAG_RESPONSE_FIELDS,
+            id=tag.id,
+            name=tag.name,
+            color=tag.color,
+            created_at=tag.created_at,
+            contact_count=contact_count,
+        )
+
+
+# Field-name set computed once so each from_orm_fast call passes a
+# prebuilt _fields_set instead of deriving one
+_TAG_RESPONSE_FIELDS = set(TagResponse.model_fields)
+
+# Reusable list serializer, built once at import (see contact.py's
+# CONTACT_LIST_ADAPTER for the rationale)
+TAG_LIST_ADAPTER = TypeAdapter(List[TagResponse])
@@ -31,5 +31,14 @@ if __name__ == "__main__":
     print(f"API Documentation: http://localhost:{port}/docs")
     print(f"Press CTRL+C to stop the server\n")
 
-    # Run the application
-    uvicorn.run("main:app", host=host, port=port, reload=True, log_level="info")
+    # Run the application with the uvloop event loop and httptools HTTP
+    # parser (both from uvicorn[standard]), matching src/main.py
+    uvicorn.run(
+        "main:app",
+        host=host,
+        port=port,
+        reload=True,
+        loop="uvloop",
+        http="httptools",
+        log_level="info",
+    )
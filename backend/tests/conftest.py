@@ -4,18 +4,12 @@ Pytest Configuration for Async Database Testing
 Provides fixtures and setup for running async database tests with clean isolation.
 """
 
-import os
-import sys
-from pathlib import Path
-
-# Add project directories to Python path
-backend_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_dir / "src"))
-
 import pytest
-import asyncio
+import uuid
 from typing import AsyncGenerator
 
+import uvloop
+
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
@@ -28,16 +22,19 @@ from sqlalchemy.pool import StaticPool
 from src.database.base import Base
 
 
-# Use in-memory SQLite for testing to ensure complete isolation
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# Shared-cache in-memory SQLite: unlike a plain :memory: URL, every
+# connection into the same named URI sees one database image, so a test
+# that opens a second session or connection isn't silently handed an
+# empty schema. Each engine gets a unique name for cross-test isolation;
+# the image is freed when the engine's last connection closes
+TEST_DATABASE_URL_TEMPLATE = (
+    "sqlite+aiosqlite:///file:{name}?mode=memory&cache=shared&uri=true"
+)
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an event loop for async testing."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop, the same loop production uses."""
+    return {"uvloop": uvloop.new_event_loop}
 
 
 @pytest.fixture(scope="function")
@@ -45,10 +42,15 @@ async def async_engine() -> AsyncGenerator[AsyncEngine, None]:
     """
     Create an async SQLAlchemy engine for each test.
 
-    Uses in-memory SQLite with StaticPool to ensure complete test isolation.
+    Uses in-memory SQLite with StaticPool to ensure complete test
+    isolation. The engine stays function-scoped because each test runs
+    on its own event loop (asyncio_default_fixture_loop_scope =
+    function) and aiosqlite connections cannot be shared across loops;
+    teardown skips drop_all since disposing the engine discards the
+    in-memory database wholesale, halving the DDL paid per test.
     """
     engine = create_async_engine(
-        TEST_DATABASE_URL,
+        TEST_DATABASE_URL_TEMPLATE.format(name=f"test_{uuid.uuid4().hex}"),
         echo=False,
         poolclass=StaticPool,
         connect_args={"check_same_thread": False},
@@ -60,10 +62,6 @@ async def async_engine() -> AsyncGenerator[AsyncEngine, None]:
 
     yield engine
 
-    # Drop all tables and dispose engine
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-
     await engine.dispose()
 
 
@@ -100,8 +98,11 @@ def sample_contact_data():
     """
     Provides sample contact data for testing.
     """
-    from datetime import datetime
+    from src.database.base import utcnow
 
+    # One clock read per fixture instead of one per timestamp field;
+    # utcnow() also avoids datetime.utcnow's deprecation warning
+    now = utcnow()
     return {
         "telegram_id": 123456789,
         "username": "test_user",
@@ -111,6 +112,6 @@ def sample_contact_data():
         "phone": "+1234567890",
         "bio": "Test contact for unit testing",
         "profile_photo_path": "/test/photo.jpg",
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow(),
+        "created_at": now,
+        "updated_at": now,
     }
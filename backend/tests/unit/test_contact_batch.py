@@ -0,0 +1,45 @@
+"""
+Unit tests for the columnar ContactBatch model
+"""
+
+from src.models.batch import ContactBatch, CONTACT_COLUMNS
+
+
+def _rows():
+    return [
+        (1, 100, "alice", "Alice", "A", "Alice A", None, None, None),
+        (2, 200, None, "Bob", None, "Bob", "+123", None, "bio"),
+    ]
+
+
+class TestContactBatch:
+    """Test structure-of-arrays batches built from cursor rows"""
+
+    def test_from_rows_transposes_columns(self):
+        """Test that row tuples become parallel column lists"""
+        batch = ContactBatch.from_rows(_rows())
+
+        assert len(batch) == 2
+        assert batch.telegram_ids == [100, 200]
+        assert batch.display_names == ["Alice A", "Bob"]
+        assert batch.usernames == ["alice", None]
+
+    def test_from_rows_empty(self):
+        """Test that an empty row set yields an empty batch"""
+        batch = ContactBatch.from_rows([])
+
+        assert len(batch) == 0
+        assert batch.to_dicts() == []
+
+    def test_to_dicts_round_trip(self):
+        """Test that to_dicts restores the original row values"""
+        rows = _rows()
+        dicts = ContactBatch.from_rows(rows).to_dicts()
+
+        assert [tuple(d[col] for col in CONTACT_COLUMNS) for d in dicts] == rows
+
+    def test_iter_display_pairs(self):
+        """Test the two-column iteration helper"""
+        batch = ContactBatch.from_rows(_rows())
+
+        assert list(batch.iter_display()) == [(100, "Alice A"), (200, "Bob")]
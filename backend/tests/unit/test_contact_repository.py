@@ -14,6 +14,7 @@ from typing import Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
+from src.database.base import utcnow
 from src.models.contact import Contact
 from src.repositories.contact_repository import ContactRepository
 
@@ -26,6 +27,7 @@ async def sample_contact_data() -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: A dictionary with contact creation parameters
     """
+    now = utcnow()
     return {
         "telegram_id": 123456789,
         "username": "test_user",
@@ -35,11 +37,29 @@ async def sample_contact_data() -> Dict[str, Any]:
         "phone": "+1234567890",
         "bio": "Test bio",
         "profile_photo_path": "/path/to/photo.jpg",
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow(),
+        "created_at": now,
+        "updated_at": now,
     }
 
 
+def test_contact_mapping_registered_once():
+    """Test that the contacts table is mapped by exactly one class
+
+    Guards against reintroducing a second Contact definition (e.g. a
+    dataclass shadowing the ORM model in the same module), which would
+    double-register the mapping with SQLAlchemy's metadata.
+    """
+    from src.database.base import Base
+    import src.models.contact as contact_module
+
+    assert "contacts" in Base.metadata.tables
+    mappers = [
+        m for m in Base.registry.mappers if m.class_.__name__ == "Contact"
+    ]
+    assert len(mappers) == 1
+    assert mappers[0].class_ is contact_module.Contact
+
+
 @pytest.mark.asyncio
 class TestContactRepository:
     """
@@ -85,6 +105,50 @@ class TestContactRepository:
         with pytest.raises((IntegrityError, ValueError)):
             await repo.create(sample_contact_data)
 
+    async def test_create_many(
+        self, async_session: AsyncSession, sample_contact_data: dict
+    ):
+        """
+        Test bulk-creating contacts in one statement.
+
+        Verifies that:
+        - All rows are inserted with generated ids
+        - Results come back in input order
+        - An empty batch is a no-op
+        """
+        repo = ContactRepository(async_session)
+        rows = [
+            {**sample_contact_data, "telegram_id": 111, "username": "first"},
+            {**sample_contact_data, "telegram_id": 222, "username": "second"},
+        ]
+
+        contacts = await repo.create_many(rows)
+
+        assert [c.telegram_id for c in contacts] == [111, 222]
+        assert all(c.id is not None for c in contacts)
+        assert all(c.created_at is not None for c in contacts)
+        assert await repo.create_many([]) == []
+
+    async def test_create_many_rolls_back_on_duplicate(
+        self, async_session: AsyncSession, sample_contact_data: dict
+    ):
+        """
+        Test that a failing batch inserts nothing.
+
+        Verifies that a duplicate telegram_id in the batch raises and
+        leaves no partial rows behind.
+        """
+        repo = ContactRepository(async_session)
+        rows = [
+            {**sample_contact_data, "telegram_id": 111, "username": "first"},
+            {**sample_contact_data, "telegram_id": 111, "username": "dupe"},
+        ]
+
+        with pytest.raises(ValueError):
+            await repo.create_many(rows)
+
+        assert await repo.get_by_telegram_id(111) is None
+
     async def test_get_by_id(
         self, async_session: AsyncSession, sample_contact_data: dict
     ):
@@ -156,6 +220,31 @@ class TestContactRepository:
         assert len(listed_contacts) > 1
         assert all(isinstance(contact, Contact) for contact in listed_contacts)
 
+    async def test_iter_all_streams_contacts(
+        self, async_session: AsyncSession, sample_contact_data: dict
+    ):
+        """
+        Test streaming contacts through the async generator.
+
+        Verifies that:
+        - All contacts are yielded
+        - A batch size smaller than the row count still covers all rows
+        """
+        repo = ContactRepository(async_session)
+        for offset in range(3):
+            await repo.create(
+                {
+                    **sample_contact_data,
+                    "telegram_id": sample_contact_data["telegram_id"] + offset,
+                    "username": f"user_{offset}",
+                }
+            )
+
+        streamed = [contact async for contact in repo.iter_all(batch_size=2)]
+
+        assert len(streamed) == 3
+        assert all(isinstance(contact, Contact) for contact in streamed)
+
     async def test_update_contact(
         self, async_session: AsyncSession, sample_contact_data: dict
     ):
@@ -250,6 +339,27 @@ class TestContactRepository:
         assert contact_profile.contact.id == created_contact.id
         assert contact_profile.contact.telegram_id == sample_contact_data["telegram_id"]
 
+    async def test_load_profiles_batch(
+        self, async_session: AsyncSession, sample_contact_data: dict
+    ):
+        """
+        Test loading several contact profiles in one batched query.
+
+        Verifies that:
+        - Profiles come back in input-id order
+        - Missing ids are skipped rather than raising
+        """
+        repo = ContactRepository(async_session)
+        first = await repo.create(sample_contact_data)
+        second = await repo.create(
+            {**sample_contact_data, "telegram_id": 987654321, "username": "second"}
+        )
+
+        profiles = await repo.load_profiles([second.id, first.id, 99999])
+
+        assert [p.contact.id for p in profiles] == [second.id, first.id]
+        assert await repo.load_profiles([]) == []
+
     async def test_search_contacts(
         self, async_session: AsyncSession, sample_contact_data: dict
     ):
@@ -11,6 +11,7 @@ import os
 
 from database.connection import (
     DatabaseConnection,
+    DatabaseConnectionPool,
     get_database,
     init_database,
     close_database,
@@ -220,6 +221,76 @@ class TestDatabaseConnection:
         exists = await in_memory_db.table_exists("nonexistent")
         assert exists is False
 
+    @pytest.mark.asyncio
+    async def test_table_exists_sees_tables_created_after_connect(self, in_memory_db):
+        """Test that the table cache doesn't hide newly created tables"""
+        assert await in_memory_db.table_exists("late") is False
+
+        await in_memory_db.execute("CREATE TABLE late (id INTEGER PRIMARY KEY)")
+        await in_memory_db.commit()
+
+        assert await in_memory_db.table_exists("late") is True
+        # Positive answers are cached for the fast path
+        assert "late" in in_memory_db._tables
+
+    @pytest.mark.asyncio
+    async def test_invalidate_table_cache(self, in_memory_db):
+        """Test that invalidation clears stale positives after a DROP"""
+        await in_memory_db.execute("CREATE TABLE doomed (id INTEGER PRIMARY KEY)")
+        await in_memory_db.commit()
+        assert await in_memory_db.table_exists("doomed") is True
+
+        await in_memory_db.execute("DROP TABLE doomed")
+        await in_memory_db.commit()
+        in_memory_db.invalidate_table_cache()
+
+        assert await in_memory_db.table_exists("doomed") is False
+
+    @pytest.mark.asyncio
+    async def test_executescript(self, in_memory_db):
+        """Test running multiple statements in one executescript call"""
+        await in_memory_db.executescript(
+            """
+            CREATE TABLE a (id INTEGER PRIMARY KEY);
+            CREATE TABLE b (id INTEGER PRIMARY KEY);
+            INSERT INTO a (id) VALUES (1);
+            """
+        )
+
+        assert await in_memory_db.table_exists("a")
+        assert await in_memory_db.table_exists("b")
+        assert await in_memory_db.get_table_count("a") == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert(self, in_memory_db):
+        """Test chunked bulk insert in one transaction"""
+        await in_memory_db.execute(
+            "CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)"
+        )
+        await in_memory_db.commit()
+
+        rows = ((i, f"name-{i}") for i in range(1201))
+        inserted = await in_memory_db.bulk_insert(
+            "test", ["id", "name"], rows, chunk_size=500
+        )
+
+        assert inserted == 1201
+        assert await in_memory_db.get_table_count("test") == 1201
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_rolls_back_on_error(self, in_memory_db):
+        """Test that a failing batch leaves no partial rows behind"""
+        await in_memory_db.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)")
+        await in_memory_db.commit()
+
+        with pytest.raises(Exception):
+            # Duplicate primary key in the second chunk
+            await in_memory_db.bulk_insert(
+                "test", ["id"], [(1,), (2,), (1,)], chunk_size=2
+            )
+
+        assert await in_memory_db.get_table_count("test") == 0
+
     @pytest.mark.asyncio
     async def test_get_table_count(self, in_memory_db):
         """Test getting row count for table"""
@@ -281,7 +352,9 @@ class TestDatabaseConnection:
         )
         await in_memory_db.commit()
 
-        # Insert but don't commit
+        # The connection runs in autocommit mode, so open an explicit
+        # transaction before the insert
+        await in_memory_db.execute("BEGIN")
         await in_memory_db.execute("INSERT INTO test (name) VALUES (?)", ("test",))
 
         # Rollback
@@ -292,6 +365,81 @@ class TestDatabaseConnection:
         assert count == 0
 
 
+class TestDatabaseConnectionPool:
+    """Test DatabaseConnectionPool class"""
+
+    @pytest.fixture
+    async def pooled_db(self):
+        """
+        Fixture providing a file-backed database with some data and a
+        read pool pointed at it
+        """
+        temp_dir = tempfile.mkdtemp()
+        db_path = os.path.join(temp_dir, "test_pool.db")
+
+        db = DatabaseConnection(db_path)
+        await db.connect()
+        await db.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+        await db.execute_many(
+            "INSERT INTO test (name) VALUES (?)", [("a",), ("b",), ("c",)]
+        )
+        await db.commit()
+
+        pool = DatabaseConnectionPool(db_path, size=2)
+
+        yield pool
+
+        await pool.close()
+        await db.disconnect()
+        try:
+            os.remove(db_path)
+            os.rmdir(temp_dir)
+        except:
+            pass
+
+    @pytest.mark.asyncio
+    async def test_fetch_one(self, pooled_db):
+        """Test fetching a single row through the pool"""
+        result = await pooled_db.fetch_one("SELECT COUNT(*) FROM test")
+        assert result[0] == 3
+
+    @pytest.mark.asyncio
+    async def test_fetch_all(self, pooled_db):
+        """Test fetching all rows through the pool"""
+        results = await pooled_db.fetch_all("SELECT name FROM test ORDER BY id")
+        assert len(results) == 3
+        assert results[0][0] == "a"
+
+    @pytest.mark.asyncio
+    async def test_acquire_returns_connection_to_pool(self, pooled_db):
+        """Test that acquired connections come from the fixed pool"""
+        async with pooled_db.acquire() as conn1:
+            async with pooled_db.acquire() as conn2:
+                # Concurrent borrows get distinct pool members
+                assert conn1 is not conn2
+
+        # Released connections go back to the pool, not get replaced
+        async with pooled_db.acquire() as conn3:
+            assert conn3 in pooled_db._connections
+        assert len(pooled_db._connections) == pooled_db.size
+
+    @pytest.mark.asyncio
+    async def test_pool_is_read_only(self, pooled_db):
+        """Test that pooled connections reject writes"""
+        with pytest.raises(Exception):
+            async with pooled_db.acquire() as conn:
+                await conn.execute("INSERT INTO test (name) VALUES ('nope')")
+
+    @pytest.mark.asyncio
+    async def test_close(self, pooled_db):
+        """Test closing the pool"""
+        await pooled_db.fetch_one("SELECT 1")
+        await pooled_db.close()
+
+        assert pooled_db._connections == []
+        assert "closed" in repr(pooled_db)
+
+
 class TestDatabaseUtilities:
     """Test database utility functions"""
 
@@ -311,6 +459,7 @@ class TestDatabaseUtilities:
 
         conn_module.get_database = mock_get_database
 
+        db = None
         try:
             db = await init_database()
             assert db is not None
@@ -318,6 +467,11 @@ class TestDatabaseUtilities:
 
             await close_database()
         finally:
+            # close_database only disconnects the module-level global,
+            # not the connection our mock handed out, so close it here
+            # to keep the aiosqlite worker thread from outliving the loop
+            if db is not None:
+                await db.disconnect()
             conn_module.get_database = original_get_database
             try:
                 os.remove(db_path)
@@ -0,0 +1,318 @@
+"""
+Unit Tests for the Migration Manager
+Tests migration ordering, dependency resolution, and repeated runs
+"""
+
+import pytest
+
+import database.migrations as migrations_module
+from database.connection import DatabaseConnection
+from database.migrations import (
+    Migration,
+    MigrationManager,
+    run_migrations,
+    verify_schema,
+)
+
+
+class RecordingMigration(Migration):
+    """Migration that records the order it was applied in"""
+
+    def __init__(self, version, applied_order, depends_on=None):
+        super().__init__(
+            version=version, name=f"migration_{version}", depends_on=depends_on
+        )
+        self._applied_order = applied_order
+
+    async def up(self, db):
+        self._applied_order.append(self.version)
+
+    async def down(self, db):
+        pass
+
+
+@pytest.fixture
+async def in_memory_db():
+    """
+    Fixture that provides an in-memory database for testing
+    """
+    db = DatabaseConnection(":memory:")
+    await db.connect()
+
+    yield db
+
+    await db.disconnect()
+
+
+@pytest.fixture(autouse=True)
+def reset_global_manager():
+    """
+    Reset the global migration manager so tests don't share state
+    """
+    migrations_module._migration_manager = None
+    yield
+    migrations_module._migration_manager = None
+
+
+class TestMigrationOrdering:
+    """Test registration order and topological sorting"""
+
+    def test_register_keeps_version_order(self, in_memory_db):
+        """Test that registrations stay sorted regardless of insert order"""
+        manager = MigrationManager(in_memory_db)
+        for version in ["003", "001", "002"]:
+            manager.register_migration(RecordingMigration(version, []))
+
+        assert [m.version for m in manager.migrations] == ["001", "002", "003"]
+
+    def test_topological_order_honours_depends_on(self, in_memory_db):
+        """Test that declared dependencies override version order"""
+        manager = MigrationManager(in_memory_db)
+        manager.register_migration(RecordingMigration("9", []))
+        manager.register_migration(RecordingMigration("010", [], depends_on=["9"]))
+
+        ordered = [m.version for m in manager._topological_order()]
+        assert ordered.index("9") < ordered.index("010")
+
+    def test_topological_order_detects_cycle(self, in_memory_db):
+        """Test that a dependency cycle raises instead of looping"""
+        manager = MigrationManager(in_memory_db)
+        manager.register_migration(RecordingMigration("001", [], depends_on=["002"]))
+        manager.register_migration(RecordingMigration("002", [], depends_on=["001"]))
+
+        with pytest.raises(ValueError):
+            manager._topological_order()
+
+    def test_duplicate_registration_is_not_a_cycle(self, in_memory_db):
+        """Test that registering the same migration twice doesn't raise"""
+        manager = MigrationManager(in_memory_db)
+        manager.register_migration(RecordingMigration("001", []))
+        manager.register_migration(RecordingMigration("001", []))
+
+        ordered = manager._topological_order()
+        assert [m.version for m in ordered] == ["001"]
+
+    def test_topological_levels_group_independent_migrations(self, in_memory_db):
+        """Test that mutually independent migrations share a level"""
+        manager = MigrationManager(in_memory_db)
+        manager.register_migration(RecordingMigration("001", []))
+        manager.register_migration(RecordingMigration("002", [], depends_on=["001"]))
+        manager.register_migration(RecordingMigration("003", [], depends_on=["001"]))
+
+        levels = [[m.version for m in level] for level in manager._topological_levels()]
+        assert levels == [["001"], ["002", "003"]]
+
+    def test_duplicate_registration_is_skipped(self, in_memory_db):
+        """Test that re-registering a version doesn't grow the list"""
+        manager = MigrationManager(in_memory_db)
+        manager.register_migration(RecordingMigration("001", []))
+        manager.register_migration(RecordingMigration("001", []))
+
+        assert len(manager.migrations) == 1
+
+
+class TestRunPendingMigrations:
+    """Test running migrations through the manager"""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_dependency_order(self, in_memory_db):
+        """Test that dependent migrations run after their dependencies"""
+        applied_order = []
+        manager = MigrationManager(in_memory_db)
+        manager.register_migration(
+            RecordingMigration("001", applied_order, depends_on=["002"])
+        )
+        manager.register_migration(RecordingMigration("002", applied_order))
+
+        assert await manager.run_pending_migrations() is True
+        assert applied_order == ["002", "001"]
+
+    @pytest.mark.asyncio
+    async def test_applied_migrations_are_not_rerun(self, in_memory_db):
+        """Test that a second run skips already applied migrations"""
+        applied_order = []
+        manager = MigrationManager(in_memory_db)
+        manager.register_migration(RecordingMigration("001", applied_order))
+
+        assert await manager.run_pending_migrations() is True
+        assert await manager.run_pending_migrations() is True
+        assert applied_order == ["001"]
+
+    @pytest.mark.asyncio
+    async def test_failed_migration_is_not_marked_applied(self, in_memory_db):
+        """Test that a failing migration stays pending"""
+
+        class FailingMigration(Migration):
+            async def up(self, db):
+                raise RuntimeError("boom")
+
+            async def down(self, db):
+                pass
+
+        manager = MigrationManager(in_memory_db)
+        manager.register_migration(FailingMigration("001", "failing"))
+
+        assert await manager.run_pending_migrations() is False
+        assert await manager.is_migration_applied("001") is False
+
+    @pytest.mark.asyncio
+    async def test_legacy_migrations_table_gains_checksum_column(self, in_memory_db):
+        """Test that a pre-checksum _migrations table is upgraded in place
+
+        Regression test: databases created before the checksum column
+        existed keep their _migrations table (CREATE TABLE IF NOT EXISTS
+        is a no-op), and the tracking INSERTs bind checksum
+        unconditionally, so migrations failed forever without the ALTER.
+        """
+        await in_memory_db.execute(
+            """
+            CREATE TABLE _migrations (
+                version TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                description TEXT,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        await in_memory_db.commit()
+
+        manager = MigrationManager(in_memory_db)
+        manager.register_migration(RecordingMigration("001", []))
+
+        assert await manager.run_pending_migrations() is True
+        assert await manager.is_migration_applied("001") is True
+
+
+class TestRunMigrationsEntryPoint:
+    """Test the module-level run_migrations entry point"""
+
+    @pytest.mark.asyncio
+    async def test_creates_schema(self, in_memory_db):
+        """Test that the real migrations produce a verifiable schema"""
+        assert await run_migrations(in_memory_db) is True
+        assert await verify_schema(in_memory_db) is True
+
+    @pytest.mark.asyncio
+    async def test_second_run_in_same_process_succeeds(self, in_memory_db):
+        """Test repeated run_migrations calls against one database
+
+        Regression test: _register_all_migrations runs on every call and
+        appends duplicates, which once tripped the cycle detector.
+        """
+        assert await run_migrations(in_memory_db) is True
+        assert await run_migrations(in_memory_db) is True
+        assert await verify_schema(in_memory_db) is True
+
+    @pytest.mark.asyncio
+    async def test_contacts_fts_index_tracks_writes(self, in_memory_db):
+        """Test that the FTS triggers keep contacts_fts in sync"""
+        assert await run_migrations(in_memory_db) is True
+        assert await in_memory_db.table_exists("contacts_fts")
+
+        await in_memory_db.execute(
+            "INSERT INTO contacts (telegram_id, display_name, first_name) "
+            "VALUES (1, 'Alice Smith', 'Alice')"
+        )
+        await in_memory_db.commit()
+
+        row = await in_memory_db.fetch_one(
+            "SELECT rowid FROM contacts_fts WHERE contacts_fts MATCH '\"alice\"*'"
+        )
+        assert row is not None
+
+        await in_memory_db.execute("DELETE FROM contacts WHERE telegram_id = 1")
+        await in_memory_db.commit()
+
+        row = await in_memory_db.fetch_one(
+            "SELECT rowid FROM contacts_fts WHERE contacts_fts MATCH '\"alice\"*'"
+        )
+        assert row is None
+
+    @pytest.mark.asyncio
+    async def test_fts_backfill_is_idempotent(self, in_memory_db):
+        """Test that re-running migration 007 doesn't duplicate FTS rows
+
+        If the tracking insert fails after the DDL ran, the next run
+        re-executes 007 against the existing tables; the 'rebuild'
+        backfill must leave exactly one index row per contact.
+        """
+        assert await run_migrations(in_memory_db) is True
+        await in_memory_db.execute(
+            "INSERT INTO contacts (telegram_id, display_name, first_name) "
+            "VALUES (1, 'Alice Smith', 'Alice')"
+        )
+        await in_memory_db.commit()
+
+        # Simulate a run where 007 executed but was never recorded
+        await in_memory_db.execute(
+            "DELETE FROM _migrations WHERE version = '007'"
+        )
+        await in_memory_db.commit()
+        migrations_module._migration_manager = None
+
+        assert await run_migrations(in_memory_db) is True
+        rows = await in_memory_db.fetch_all(
+            "SELECT rowid FROM contacts_fts WHERE contacts_fts MATCH '\"alice\"*'"
+        )
+        assert len(rows) == 1
+
+    @pytest.mark.asyncio
+    async def test_legacy_text_timestamps_are_converted(self, in_memory_db):
+        """Test that migration 009 rewrites pre-retype TEXT timestamps
+
+        Regression test: databases created before messages.timestamp
+        became INTEGER epoch microseconds held ISO-8601 text, which
+        crashed every read path that divides the value by 1_000_000.
+        """
+        assert await run_migrations(in_memory_db) is True
+        await in_memory_db.execute(
+            "INSERT INTO contacts (telegram_id, display_name) VALUES (1, 'Alice')"
+        )
+        contact = await in_memory_db.fetch_one(
+            "SELECT id FROM contacts WHERE telegram_id = 1"
+        )
+        await in_memory_db.execute(
+            "INSERT INTO messages (contact_id, is_outgoing, content, timestamp) "
+            "VALUES (?, 0, 'hi', '2024-01-02 03:04:05.123456')",
+            (contact[0],),
+        )
+        # Simulate a pre-009 database: a text row exists and 009 has
+        # not been recorded yet
+        await in_memory_db.execute(
+            "DELETE FROM _migrations WHERE version = '009'"
+        )
+        await in_memory_db.commit()
+        migrations_module._migration_manager = None
+
+        assert await run_migrations(in_memory_db) is True
+        stored = await in_memory_db.fetch_one(
+            "SELECT typeof(timestamp), timestamp FROM messages"
+        )
+        assert stored[0] == "integer"
+        assert stored[1] == 1704164645123456
+
+    @pytest.mark.asyncio
+    async def test_indexes_can_be_dropped_and_rebuilt(self, in_memory_db):
+        """Test the deferred-index helpers used around bulk loads"""
+        from src.database.migrations.migration_001_initial_schema import (
+            create_indexes,
+            drop_indexes,
+        )
+
+        assert await run_migrations(in_memory_db) is True
+
+        async def count_indexes():
+            row = await in_memory_db.fetch_one(
+                "SELECT COUNT(*) FROM sqlite_master "
+                "WHERE type='index' AND name LIKE 'idx_%'"
+            )
+            return row[0]
+
+        before = await count_indexes()
+        assert before > 0
+
+        await drop_indexes(in_memory_db)
+        assert await count_indexes() == 0
+
+        await create_indexes(in_memory_db)
+        assert await count_indexes() == before
@@ -131,6 +131,29 @@ class TestContactResponse:
         assert contact.username is None
         assert len(contact.tags) == 0
 
+    def test_contact_response_from_orm_fast(self):
+        """Test the validation-skipping constructor from an ORM contact."""
+        from src.models.contact import Contact
+
+        orm_contact = Contact(
+            id=1,
+            telegram_id=123456789,
+            username="john_doe",
+            first_name="John",
+            last_name="Doe",
+            display_name="John Doe",
+            phone="+1234567890",
+            profile_photo_path="/api/media/profile-photos/123456789.jpg",
+            updated_at=datetime.now(),
+        )
+
+        contact = ContactResponse.from_orm_fast(orm_contact, tags=["Work"])
+
+        assert contact.id == 1
+        assert contact.profile_photo_url == orm_contact.profile_photo_path
+        assert contact.tags == ["Work"]
+        assert contact.model_dump()["telegram_id"] == 123456789
+
 
 class TestContactProfileResponse:
     """Tests for ContactProfileResponse schema."""
@@ -0,0 +1,181 @@
+"""
+Unit Tests for Synchronous Database Connection
+Tests the SyncDatabase class used by single-shot CLI commands
+"""
+
+import pytest
+from pathlib import Path
+import tempfile
+import os
+
+from database.sync_connection import SyncDatabase
+from database.migration_runner import get_database_stats_sync
+
+
+@pytest.fixture
+def sync_db():
+    """
+    Fixture that provides an in-memory synchronous database for testing
+    """
+    db = SyncDatabase(":memory:")
+    db.connect()
+
+    yield db
+
+    db.disconnect()
+
+
+class TestSyncDatabase:
+    """Test SyncDatabase class"""
+
+    def test_connect_creates_database_file(self):
+        """Test that connect creates database file"""
+        temp_dir = tempfile.mkdtemp()
+        db_path = os.path.join(temp_dir, "test_sync.db")
+
+        db = SyncDatabase(db_path)
+        db.connect()
+
+        assert Path(db_path).exists()
+
+        db.disconnect()
+        os.remove(db_path)
+        os.rmdir(temp_dir)
+
+    def test_connect_enables_foreign_keys(self, sync_db):
+        """Test that foreign keys are enabled"""
+        result = sync_db.fetch_one("PRAGMA foreign_keys")
+        assert result[0] == 1
+
+    def test_get_connection_reuses_existing(self, sync_db):
+        """Test that get_connection reuses existing connection"""
+        conn1 = sync_db.get_connection()
+        conn2 = sync_db.get_connection()
+
+        assert conn1 is conn2
+
+    def test_execute_with_parameters(self, sync_db):
+        """Test executing query with parameters"""
+        sync_db.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+        sync_db.execute("INSERT INTO test (name) VALUES (?)", ("test_name",))
+        sync_db.commit()
+
+        result = sync_db.fetch_one("SELECT name FROM test")
+        assert result[0] == "test_name"
+
+    def test_execute_many(self, sync_db):
+        """Test executing query with multiple parameter sets"""
+        sync_db.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+        sync_db.execute_many(
+            "INSERT INTO test (name) VALUES (?)", [("a",), ("b",), ("c",)]
+        )
+        sync_db.commit()
+
+        assert sync_db.get_table_count("test") == 3
+
+    def test_fetch_one_no_result(self, sync_db):
+        """Test fetch_one returns None when no results"""
+        sync_db.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+
+        result = sync_db.fetch_one("SELECT * FROM test WHERE id = 999")
+        assert result is None
+
+    def test_fetch_all(self, sync_db):
+        """Test fetching all rows"""
+        sync_db.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+        sync_db.execute_many(
+            "INSERT INTO test (name) VALUES (?)", [("name1",), ("name2",)]
+        )
+        sync_db.commit()
+
+        results = sync_db.fetch_all("SELECT name FROM test ORDER BY id")
+        assert len(results) == 2
+        assert results[0][0] == "name1"
+
+    def test_transaction_commit(self, sync_db):
+        """Test transaction context manager commits on success"""
+        sync_db.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+        sync_db.commit()
+
+        with sync_db.transaction():
+            sync_db.execute("INSERT INTO test (name) VALUES (?)", ("test",))
+
+        assert sync_db.get_table_count("test") == 1
+
+    def test_transaction_rollback_on_error(self, sync_db):
+        """Test transaction rolls back on error"""
+        sync_db.execute("CREATE TABLE test (id INTEGER PRIMARY KEY UNIQUE, name TEXT)")
+        sync_db.execute("INSERT INTO test (id, name) VALUES (1, 'test')")
+        sync_db.commit()
+
+        try:
+            with sync_db.transaction():
+                sync_db.execute("INSERT INTO test (id, name) VALUES (1, 'duplicate')")
+        except Exception:
+            pass
+
+        assert sync_db.get_table_count("test") == 1
+
+    def test_table_exists(self, sync_db):
+        """Test table_exists for existing and missing tables"""
+        sync_db.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)")
+        sync_db.commit()
+
+        assert sync_db.table_exists("test") is True
+        assert sync_db.table_exists("nonexistent") is False
+
+    def test_disconnect(self, sync_db):
+        """Test disconnecting from database"""
+        assert sync_db._connection is not None
+
+        sync_db.disconnect()
+
+        assert sync_db._connection is None
+
+    def test_repr(self, sync_db):
+        """Test string representation"""
+        repr_str = repr(sync_db)
+        assert "SyncDatabase" in repr_str
+        assert "connected" in repr_str
+
+
+class TestGetDatabaseStatsSync:
+    """Test the synchronous database statistics helper"""
+
+    @pytest.fixture
+    def stats_db(self, sync_db):
+        """Fixture with the stats tables created and a few rows inserted"""
+        for table in ["contacts", "groups", "tags", "messages", "sync_log"]:
+            sync_db.execute(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY)")
+        sync_db.execute_many(
+            "INSERT INTO contacts (id) VALUES (?)", [(1,), (2,), (3,)]
+        )
+        sync_db.commit()
+        return sync_db
+
+    def test_exact_counts(self, stats_db):
+        """Test exact row counts via full COUNT scans"""
+        stats = get_database_stats_sync(stats_db, exact=True)
+
+        assert stats["contacts"] == 3
+        assert stats["groups"] == 0
+
+    def test_estimates_after_analyze(self, stats_db):
+        """Test that ANALYZE-produced estimates are served without scans"""
+        stats_db.execute("ANALYZE")
+        stats_db.commit()
+
+        stats = get_database_stats_sync(stats_db)
+
+        # sqlite_stat1 only has rows for tables with data
+        assert stats["contacts"] == 3
+
+    def test_missing_table_reports_negative(self, stats_db):
+        """Test that a dropped table shows -1 instead of failing the call"""
+        stats_db.execute("DROP TABLE sync_log")
+        stats_db.commit()
+
+        stats = get_database_stats_sync(stats_db, exact=True)
+
+        assert stats["sync_log"] == -1
+        assert stats["contacts"] == 3
@@ -369,6 +369,23 @@ class TestTagRepositoryAssociations:
         tag_names = {tag.name for tag in tags}
         assert tag_names == {"Work", "Personal", "Urgent"}
 
+    @pytest.mark.asyncio
+    async def test_get_tags_for_contacts_batch(self, tag_repository, sample_contact):
+        """Test batched tag loading groups rows per contact."""
+        tag1 = await tag_repository.create({"name": "Work"})
+        tag2 = await tag_repository.create({"name": "Personal"})
+
+        await tag_repository.add_tag_to_contact(sample_contact.id, tag1.id)
+        await tag_repository.add_tag_to_contact(sample_contact.id, tag2.id)
+
+        grouped = await tag_repository.get_tags_for_contacts(
+            [sample_contact.id, 99999]
+        )
+
+        assert [t.name for t in grouped[sample_contact.id]] == ["Personal", "Work"]
+        assert grouped[99999] == []
+        assert await tag_repository.get_tags_for_contacts([]) == {}
+
     @pytest.mark.asyncio
     async def test_get_contacts_by_tag_empty(self, tag_repository, sample_tag):
         """Test getting contacts for a tag with no contacts."""